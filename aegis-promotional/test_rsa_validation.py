@@ -17,16 +17,12 @@ def compute_key_hash(key):
     """Replicate the VBScript ComputeKeyHash function EXACTLY"""
     h = 0
     r = 0x5A3C
-    for c in key.upper():
-        code = ord(c)
+    for code in map(ord, key.upper()):
         h = ((h * 31) + code) & 0x7FFFFFFF
         r = ((r ^ code) * 17) & 0xFFFF
     
     combined = format(h, 'x') + format(r, 'x')
-    result = combined[:16].lower()
-    while len(result) < 16:
-        result = '0' + result
-    return result
+    return combined[:16].zfill(16)
 
 def test_server_rsa_signing():
     """Test that the server is properly signing licenses"""
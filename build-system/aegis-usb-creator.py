@@ -249,7 +249,7 @@ class LicenseValidator:
         if expected_prefix and not key.startswith(expected_prefix):
             return False, f"Invalid key for {edition_info['name']}. Key must start with {expected_prefix}-"
         
-        checksum = sum(ord(c) for c in key.replace('-', ''))
+        checksum = sum(map(ord, key.replace('-', '')))
         if checksum % 7 != 0:
             return False, "Invalid license key checksum"
         
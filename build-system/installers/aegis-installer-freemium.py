@@ -8,6 +8,7 @@ with option to download from Aegis servers if not found locally
 import os
 import sys
 import hashlib
+import hmac
 import threading
 import subprocess
 from pathlib import Path
@@ -15,6 +16,8 @@ import time
 import webbrowser
 import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 import urllib.request
 import urllib.error
 import ssl
@@ -69,6 +72,19 @@ ISO_DOWNLOAD_URLS = {
 }
 ISO_CHECKSUM_URL = "https://download.aegis-os.com/iso/aegis-freemium.iso.sha256"
 DEFAULT_DOWNLOAD_DIR = Path.home() / "Downloads" / "AegisOS"
+PARALLEL_DOWNLOAD_STREAMS = 4
+PARALLEL_DOWNLOAD_MIN_SIZE = 64 * 1024 * 1024
+RANGE_STATE_SUFFIX = ".ranges.json"
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+PROGRESS_UPDATE_INTERVAL_MS = 100
+HASH_SIDECAR_SUFFIX = ".aegishash"
+# Platform hash tools, in order of preference; each prints the digest for a path
+NATIVE_SHA256_COMMANDS = [
+    ["openssl", "dgst", "-sha256", "-r"],
+    ["sha256sum"],
+    ["shasum", "-a", "256"],
+    ["certutil", "-hashfile"],
+]
 ALT_ISO_FILENAMES = [
     "aegis-freemium.iso",
     "AegisOS-Freemium.iso",
@@ -100,6 +116,121 @@ def is_placeholder_checksum(checksum):
     return False
 
 
+def read_hash_sidecar(path):
+    """Cached SHA-256 of an ISO, or None if it was never hashed or has changed on disk"""
+    try:
+        st = os.stat(path)
+        with open(str(path) + HASH_SIDECAR_SUFFIX, 'r') as f:
+            cached = json.load(f)
+        if cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+            return cached.get("sha256")
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+
+def write_hash_sidecar(path, sha256_hash):
+    """Remember an ISO's SHA-256 for the next install (no-op when its folder is read-only, e.g. a DVD)"""
+    sidecar = str(path) + HASH_SIDECAR_SUFFIX
+    temp_path = sidecar + ".tmp"
+    try:
+        st = os.stat(path)
+        with open(temp_path, 'w') as f:
+            json.dump({
+                "sha256": sha256_hash,
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size
+            }, f)
+        os.replace(temp_path, sidecar)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def sha256_matches(actual, expected):
+    """Constant-time comparison of two hex SHA-256 digests, ignoring case"""
+    try:
+        return hmac.compare_digest(bytes.fromhex(actual), bytes.fromhex(expected))
+    except ValueError:
+        return False
+
+
+def advise_file(f, advice_name):
+    """Best-effort posix_fadvise() hint for a whole open file; no-op elsewhere"""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, advice)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def find_native_sha256_tool():
+    """Return the first native SHA-256 command available on PATH, if any"""
+    for command in NATIVE_SHA256_COMMANDS:
+        if shutil.which(command[0]):
+            return tuple(command)
+    return None
+
+
+def native_sha256(path):
+    """Hash path with the platform's SHA-256 tool; None if there is none or it fails"""
+    command = find_native_sha256_tool()
+    if command is None:
+        return None
+    
+    args = list(command) + [str(path)]
+    is_certutil = command[0] == "certutil"
+    if is_certutil:
+        args.append("SHA256")
+    
+    # The tools echo the path back, and certutil prints in the console code
+    # page; only the hex digest matters, so undecodable bytes are replaced
+    try:
+        result = subprocess.run(args, capture_output=True, text=True, errors="replace",
+                                check=True,
+                                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    
+    # "<hex> <path>" for openssl -r / sha256sum / shasum; certutil puts the
+    # digest on a line of its own, space-separated on older Windows
+    for line in result.stdout.splitlines():
+        digest = line.replace(" ", "") if is_certutil else line.split(" ", 1)[0].lstrip("\\")
+        if len(digest) == 64 and all(c in "0123456789abcdefABCDEF" for c in digest):
+            return digest.upper()
+    return None
+
+
+class CopyCancelled(Exception):
+    """Raised from inside a copy to stop it when the user cancels"""
+
+
+class HashingWriter:
+    """File-like wrapper that hashes each block on its way to the real file"""
+    
+    def __init__(self, f, sha256, on_write=None):
+        self.f = f
+        self.sha256 = sha256
+        self.on_write = on_write
+        # copyfileobj calls write() once per block; bind what it uses up front
+        # instead of looking it up again for every block
+        self._hash_block = sha256.update
+        self._write_block = f.write
+    
+    def write(self, data):
+        self._hash_block(data)
+        written = self._write_block(data)
+        on_write = self.on_write
+        if on_write:
+            on_write(len(data))
+        return written
+
+
 class OfflineISOLocator:
     """Handles offline ISO detection from local sources"""
     
@@ -265,6 +396,7 @@ class ISODownloader:
         self.download_thread = None
         self._last_bytes = 0
         self._last_time = 0
+        self._ssl_context = None
     
     def cancel(self):
         """Cancel the current download"""
@@ -272,12 +404,14 @@ class ISODownloader:
     
     def _get_ssl_context(self):
         """Create SSL context with fallback for certificate issues"""
-        try:
-            context = ssl.create_default_context()
-            return context
-        except Exception:
-            context = ssl._create_unverified_context()
-            return context
+        # Built once per downloader: loading the CA store is the costly part,
+        # and the HEAD, checksum and every range request can share it
+        if self._ssl_context is None:
+            try:
+                self._ssl_context = ssl.create_default_context()
+            except Exception:
+                self._ssl_context = ssl._create_unverified_context()
+        return self._ssl_context
     
     def _check_internet(self):
         """Check if internet connection is available"""
@@ -314,6 +448,62 @@ class ISODownloader:
         except Exception:
             return None
     
+    def _report_progress(self, downloaded, total_size, existing_size, start_time, now):
+        """Send size, speed and ETA for the current download to the callback"""
+        elapsed = now - start_time
+        speed_bytes = (downloaded - existing_size) / elapsed if elapsed > 0 else 0
+        speed_mb = speed_bytes / (1024 * 1024)
+        
+        if total_size > 0:
+            pct = int((downloaded / total_size) * 100)
+            remaining = total_size - downloaded
+            eta_secs = remaining / speed_bytes if speed_bytes > 0 else 0
+            
+            if eta_secs > 3600:
+                eta_str = f"{int(eta_secs/3600)}h {int((eta_secs%3600)/60)}m"
+            elif eta_secs > 60:
+                eta_str = f"{int(eta_secs/60)}m {int(eta_secs%60)}s"
+            else:
+                eta_str = f"{int(eta_secs)}s"
+            
+            size_mb = downloaded / (1024 * 1024)
+            total_mb = total_size / (1024 * 1024)
+            
+            if self.progress_callback:
+                self.progress_callback(
+                    pct,
+                    f"Downloading: {size_mb:.0f} / {total_mb:.0f} MB",
+                    f"{speed_mb:.1f} MB/s • ETA: {eta_str}"
+                )
+        else:
+            size_mb = downloaded / (1024 * 1024)
+            if self.progress_callback:
+                self.progress_callback(
+                    -1,
+                    f"Downloading: {size_mb:.0f} MB",
+                    f"{speed_mb:.1f} MB/s"
+                )
+        
+        self._last_time = now
+        self._last_bytes = downloaded
+    
+    def _get_range_download_size(self, url):
+        """
+        Size of the remote file if the server accepts byte ranges, 0 if it
+        does not, or None if the server could not be reached
+        """
+        try:
+            context = self._get_ssl_context()
+            request = urllib.request.Request(url, method='HEAD')
+            request.add_header('User-Agent', f'AegisOS-Installer/{VERSION}')
+            
+            with urllib.request.urlopen(request, timeout=10, context=context) as response:
+                if 'bytes' not in response.headers.get('Accept-Ranges', '').lower():
+                    return 0
+                return int(response.headers.get('Content-Length', 0))
+        except Exception:
+            return None
+    
     def download(self, url, destination, expected_sha256=None, fallback_url=None, checksum_url=None):
         """
         Download ISO with progress, resume support, and verification
@@ -341,19 +531,176 @@ class ISODownloader:
         
         partial_path = Path(str(destination) + ".partial")
         
-        success, message, sha256_hash = self._download_with_resume(
+        success, message, sha256_hash = self._download_from(
             url, destination, partial_path, expected_sha256
         )
         
         if not success and fallback_url and not self.cancelled:
             if self.progress_callback:
                 self.progress_callback(0, "Trying fallback server...", "")
-            success, message, sha256_hash = self._download_with_resume(
+            success, message, sha256_hash = self._download_from(
                 fallback_url, destination, partial_path, expected_sha256
             )
         
         return success, message, sha256_hash
     
+    def _download_from(self, url, destination, partial_path, expected_sha256):
+        """Parallel range download where possible, single stream otherwise"""
+        result = self._download_parallel(url, destination, partial_path, expected_sha256)
+        if result is None:
+            result = self._download_with_resume(url, destination, partial_path, expected_sha256)
+        return result
+    
+    def _load_range_state(self, state_path, partial_path, total_size):
+        """Remaining (start, end) ranges of an interrupted parallel download"""
+        try:
+            with open(state_path, 'r') as f:
+                state = json.load(f)
+            if (total_size <= 0 or state.get("total_size") != total_size
+                    or partial_path.stat().st_size != total_size):
+                return None
+            return [(int(start), int(end)) for start, end in state["ranges"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_range_state(self, state_path, total_size, ranges):
+        """Record how far each range got, so the next attempt can resume"""
+        remaining = [[self._range_next[index], end] for index, (_, end) in enumerate(ranges)]
+        try:
+            with open(state_path, 'w') as f:
+                json.dump({"total_size": total_size, "ranges": remaining}, f)
+        except OSError:
+            pass
+    
+    def _download_parallel(self, url, destination, partial_path, expected_sha256):
+        """
+        Download the ISO over several connections, one byte range each
+        
+        An interrupted or cancelled run keeps its .partial file plus a
+        RANGE_STATE_SUFFIX side-car with each range's progress, and the next
+        call picks up from there. Returns None when the single-stream download
+        should be used instead: the server does not support ranges, the file
+        is too small to benefit, or a .partial from a single-stream run exists.
+        """
+        try:
+            state_path = Path(str(partial_path) + RANGE_STATE_SUFFIX)
+            resuming = state_path.exists()
+            if partial_path.exists() and not resuming:
+                return None
+            
+            total_size = self._get_range_download_size(url)
+            if total_size is None:
+                if resuming:
+                    # Keep the saved progress for when the server is reachable again
+                    return False, "Connection failed: download server unreachable", None
+                return None
+            
+            ranges = self._load_range_state(state_path, partial_path, total_size) if resuming else None
+            
+            if ranges is None:
+                state_path.unlink(missing_ok=True)
+                partial_path.unlink(missing_ok=True)
+                if total_size < PARALLEL_DOWNLOAD_MIN_SIZE:
+                    return None
+            
+                # Reserve the whole file up front so the ranges do not grow it piecemeal;
+                # truncate() leaves a sparse file where fallocate is unavailable
+                with open(partial_path, 'wb') as f:
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, total_size)
+                    except (AttributeError, OSError):
+                        f.truncate(total_size)
+            
+                segment = -(-total_size // PARALLEL_DOWNLOAD_STREAMS)
+                ranges = [(start, min(start + segment, total_size) - 1)
+                          for start in range(0, total_size, segment)]
+            
+            already_downloaded = total_size - sum(max(end - start + 1, 0) for start, end in ranges)
+            self._range_next = [start for start, _ in ranges]
+            self._range_downloaded = already_downloaded
+            self._range_lock = threading.Lock()
+            abort = threading.Event()
+            start_time = time.time()
+            self._last_time = start_time
+            
+            with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                futures = [pool.submit(self._download_range, url, partial_path, index, end, abort)
+                           for index, (_, end) in enumerate(ranges)]
+                pending = futures
+                while pending:
+                    _, pending = wait(pending, timeout=0.3)
+                    if any(f.done() and (f.exception() or not f.result()) for f in futures):
+                        abort.set()
+                    self._report_progress(self._range_downloaded, total_size, already_downloaded,
+                                          start_time, time.time())
+            
+            if not (self.cancelled or abort.is_set()):
+                # os.replace, not rename: Windows refuses to rename onto an ISO the
+                # user chose to replace. If even that fails, record the finished
+                # ranges so a retry only has to move the file into place.
+                try:
+                    os.replace(partial_path, destination)
+                except OSError:
+                    self._save_range_state(state_path, total_size, ranges)
+                    raise
+                state_path.unlink(missing_ok=True)
+                return self._verify_download(destination, expected_sha256)
+            
+            if any(f.exception() is None and f.result() is False for f in futures):
+                # The server answered a range with the whole file after all
+                state_path.unlink(missing_ok=True)
+                partial_path.unlink(missing_ok=True)
+                return None
+            
+            self._save_range_state(state_path, total_size, ranges)
+            if self.cancelled:
+                return False, "Download cancelled by user", None
+            
+            error = next(f.exception() for f in futures if f.exception())
+            return False, f"Download interrupted: {error}", None
+        except urllib.error.URLError as e:
+            if hasattr(e, 'reason'):
+                return False, f"Connection failed: {e.reason}", None
+            return False, f"URL error: {e}", None
+        except socket.timeout:
+            return False, "Connection timed out", None
+        except Exception as e:
+            return False, f"Download failed: {str(e)}", None
+    
+    def _download_range(self, url, partial_path, index, end, abort):
+        """
+        Fetch range `index` from its next unfetched byte through `end` into
+        partial_path. Returns False if the server ignored the Range header.
+        """
+        start = self._range_next[index]
+        if start > end:
+            return True
+        
+        context = self._get_ssl_context()
+        request = urllib.request.Request(url)
+        request.add_header('User-Agent', f'AegisOS-Installer/{VERSION}')
+        request.add_header('Range', f'bytes={start}-{end}')
+        
+        with urllib.request.urlopen(request, timeout=30, context=context) as response:
+            if response.status != 206:
+                return False
+            
+            with open(partial_path, 'r+b') as f:
+                advise_file(f, "POSIX_FADV_SEQUENTIAL")
+                f.seek(start)
+                while not (self.cancelled or abort.is_set()):
+                    chunk = response.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    with self._range_lock:
+                        self._range_next[index] += len(chunk)
+                        self._range_downloaded += len(chunk)
+        
+        if not (self.cancelled or abort.is_set()) and self._range_next[index] != end + 1:
+            raise IOError(f"Incomplete range {start}-{end}")
+        return True
+    
     def _download_with_resume(self, url, destination, partial_path, expected_sha256):
         """Download with resume support"""
         try:
@@ -374,7 +721,7 @@ class ISODownloader:
             except urllib.error.HTTPError as e:
                 if e.code == 416:
                     if partial_path.exists():
-                        partial_path.rename(destination)
+                        os.replace(partial_path, destination)
                         return self._verify_download(destination, expected_sha256)
                 raise
             
@@ -396,60 +743,42 @@ class ISODownloader:
             
             mode = 'ab' if existing_size > 0 and response.status == 206 else 'wb'
             
+            # _verify_download takes the digest from here instead of reading the
+            # ISO back; bytes already in a resumed .partial are hashed up front
+            sha256 = hashlib.sha256()
+            if mode == 'ab' and not self._hash_into(partial_path, sha256):
+                return False, "Download cancelled by user", None
+            
+            # Runs once per 1 MiB block, so the clock is bound outside it
+            clock = time.time
+            
+            def on_write(length):
+                nonlocal downloaded
+                downloaded += length
+                now = clock()
+                if now - self._last_time >= 0.3:
+                    self._report_progress(downloaded, total_size, existing_size, start_time, now)
+                if self.cancelled:
+                    raise CopyCancelled()
+            
             with open(partial_path, mode) as f:
-                while True:
-                    if self.cancelled:
-                        return False, "Download cancelled by user", None
-                    
-                    chunk = response.read(1024 * 1024)
-                    if not chunk:
-                        break
-                    
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    
-                    now = time.time()
-                    if now - self._last_time >= 0.3:
-                        elapsed = now - start_time
-                        speed_bytes = (downloaded - existing_size) / elapsed if elapsed > 0 else 0
-                        speed_mb = speed_bytes / (1024 * 1024)
-                        
-                        if total_size > 0:
-                            pct = int((downloaded / total_size) * 100)
-                            remaining = total_size - downloaded
-                            eta_secs = remaining / speed_bytes if speed_bytes > 0 else 0
-                            
-                            if eta_secs > 3600:
-                                eta_str = f"{int(eta_secs/3600)}h {int((eta_secs%3600)/60)}m"
-                            elif eta_secs > 60:
-                                eta_str = f"{int(eta_secs/60)}m {int(eta_secs%60)}s"
-                            else:
-                                eta_str = f"{int(eta_secs)}s"
-                            
-                            size_mb = downloaded / (1024 * 1024)
-                            total_mb = total_size / (1024 * 1024)
-                            
-                            if self.progress_callback:
-                                self.progress_callback(
-                                    pct,
-                                    f"Downloading: {size_mb:.0f} / {total_mb:.0f} MB",
-                                    f"{speed_mb:.1f} MB/s • ETA: {eta_str}"
-                                )
-                        else:
-                            size_mb = downloaded / (1024 * 1024)
-                            if self.progress_callback:
-                                self.progress_callback(
-                                    -1,
-                                    f"Downloading: {size_mb:.0f} MB",
-                                    f"{speed_mb:.1f} MB/s"
-                                )
-                        
-                        self._last_time = now
-                        self._last_bytes = downloaded
+                advise_file(f, "POSIX_FADV_SEQUENTIAL")
+                if self.cancelled:
+                    return False, "Download cancelled by user", None
+                try:
+                    shutil.copyfileobj(response, HashingWriter(f, sha256, on_write), 1024 * 1024)
+                except CopyCancelled:
+                    return False, "Download cancelled by user", None
+                
+                # The ISO is not read again here, so let the kernel drop
+                # whatever part of it has already been written back
+                f.flush()
+                advise_file(f, "POSIX_FADV_DONTNEED")
             
-            partial_path.rename(destination)
+            os.replace(partial_path, destination)
             
-            return self._verify_download(destination, expected_sha256)
+            return self._verify_download(destination, expected_sha256,
+                                         sha256.hexdigest().upper())
             
         except urllib.error.URLError as e:
             if hasattr(e, 'reason'):
@@ -460,34 +789,41 @@ class ISODownloader:
         except Exception as e:
             return False, f"Download failed: {str(e)}", None
     
-    def _verify_download(self, filepath, expected_sha256):
-        """Verify downloaded file checksum"""
-        if self.progress_callback:
-            self.progress_callback(99, "Verifying checksum...", "")
-        
-        sha256 = hashlib.sha256()
-        file_size = Path(filepath).stat().st_size
-        processed = 0
-        
+    def _hash_into(self, filepath, sha256):
+        """Feed a file into sha256; returns False if cancelled part way"""
         with open(filepath, 'rb') as f:
+            advise_file(f, "POSIX_FADV_SEQUENTIAL")
             while True:
                 if self.cancelled:
-                    return False, "Verification cancelled", None
+                    return False
                 
-                chunk = f.read(8192)
+                chunk = f.read(HASH_CHUNK_SIZE)
                 if not chunk:
                     break
                 sha256.update(chunk)
-                processed += len(chunk)
+            advise_file(f, "POSIX_FADV_DONTNEED")
+        return True
+    
+    def _verify_download(self, filepath, expected_sha256, actual_hash=None):
+        """Verify downloaded file checksum"""
+        if self.progress_callback:
+            self.progress_callback(99, "Verifying checksum...", "")
         
-        actual_hash = sha256.hexdigest().upper()
+        # Range downloads arrive out of order and an already-complete .partial
+        # was never streamed, so only those still read the file back
+        if actual_hash is None:
+            sha256 = hashlib.sha256()
+            if not self._hash_into(filepath, sha256):
+                return False, "Verification cancelled", None
+            actual_hash = sha256.hexdigest().upper()
         
         if expected_sha256:
             expected = expected_sha256.upper()
-            if actual_hash != expected:
+            if not sha256_matches(actual_hash, expected):
                 Path(filepath).unlink(missing_ok=True)
                 return False, f"Checksum mismatch!\nExpected: {expected[:16]}...\nGot: {actual_hash[:16]}...", None
         
+        write_hash_sidecar(filepath, actual_hash)
         return True, "Download completed successfully", actual_hash
 
 
@@ -508,6 +844,12 @@ class AegisFreemiumInstaller:
         self.manifest_data = None
         self.is_downloading = False
         self.iso_downloader = None
+        self._step2_built = False
+        self._step3_built = False
+        
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._progress_flush_scheduled = False
         
         self._setup_styles()
         self._create_ui()
@@ -518,34 +860,7 @@ class AegisFreemiumInstaller:
         style = ttk.Style()
         style.theme_use('clam')
         
-        style.configure("Header.TFrame", background="#0078D7")
-        style.configure("Header.TLabel", background="#0078D7", foreground="white", 
-                       font=("Segoe UI", 18, "bold"))
-        style.configure("HeaderSub.TLabel", background="#0078D7", foreground="#E0E0E0",
-                       font=("Segoe UI", 11))
-        
-        style.configure("Section.TFrame", background="white", relief="solid", borderwidth=1)
-        style.configure("Section.TLabel", background="white", font=("Segoe UI", 10))
-        style.configure("SectionTitle.TLabel", background="white", foreground="#0078D7",
-                       font=("Segoe UI", 12, "bold"))
-        
-        style.configure("Feature.TLabel", background="white", font=("Segoe UI", 9))
-        style.configure("Path.TLabel", background="#f5f5f5", font=("Consolas", 10))
-        
-        style.configure("Progress.TLabel", background="white", font=("Segoe UI", 36, "bold"),
-                       foreground="#0078D7")
-        style.configure("ProgressText.TLabel", background="white", font=("Segoe UI", 10),
-                       foreground="#666666")
-        
-        style.configure("Success.TLabel", background="white", font=("Segoe UI", 16),
-                       foreground="#0078D7")
-        style.configure("Error.TLabel", background="white", font=("Segoe UI", 12),
-                       foreground="#d32f2f")
-        style.configure("Found.TLabel", background="white", foreground="#28a745",
-                       font=("Segoe UI", 10))
-        style.configure("NotFound.TLabel", background="white", foreground="#dc3545",
-                       font=("Segoe UI", 10))
-        
+        # Only the ttk buttons and progress bar are styled; the rest of the UI is plain tk
         style.configure("Primary.TButton", font=("Segoe UI", 10, "bold"))
         style.configure("TButton", font=("Segoe UI", 10))
         
@@ -588,8 +903,6 @@ class AegisFreemiumInstaller:
         self.step3_frame = tk.Frame(self.content, bg="#f0f0f0")
         
         self._create_step1()
-        self._create_step2()
-        self._create_step3()
         
         footer = tk.Frame(self.root, bg="#e0e0e0", height=55)
         footer.pack(fill="x", side="bottom")
@@ -750,6 +1063,15 @@ class AegisFreemiumInstaller:
                 font=("Segoe UI", 10), bg="white").pack(anchor="w", pady=2)
     
     def _show_step(self, step):
+        # A user who only follows the Etcher link never leaves step 1, so the
+        # install progress and result pages wait until the install starts
+        if step == 2 and not self._step2_built:
+            self._create_step2()
+            self._step2_built = True
+        elif step == 3 and not self._step3_built:
+            self._create_step3()
+            self._step3_built = True
+        
         self.step1_frame.pack_forget()
         self.step2_frame.pack_forget()
         self.step3_frame.pack_forget()
@@ -869,15 +1191,17 @@ class AegisFreemiumInstaller:
     def _download_complete(self, dest_path, sha256_hash):
         """Handle successful download completion"""
         def complete():
+            self._discard_pending_progress()
+            self._show_step(3)
             self.final_iso_path_label.configure(text=dest_path)
             self.hash_label.configure(text=sha256_hash)
-            self._show_step(3)
         
         self.root.after(0, complete)
     
     def _show_download_error(self, message):
         """Show download error and allow retry"""
         def show():
+            self._discard_pending_progress()
             self.progress_pct.configure(text="!", fg="#d32f2f")
             self.progress_text.configure(text=message, fg="#d32f2f")
             self.progress_speed.configure(text="")
@@ -954,84 +1278,86 @@ class AegisFreemiumInstaller:
             
             dest_path = os.path.join(self.install_folder, os.path.basename(self.iso_path))
             
+            if self.iso_path == dest_path:
+                self._update_progress(0, "Verifying source ISO...", "")
+                
+                # Unchanged since it was last hashed (retry, re-run, or just downloaded)
+                source_hash = read_hash_sidecar(self.iso_path)
+                if not source_hash:
+                    sha256 = hashlib.sha256()
+                    with open(self.iso_path, 'rb') as src:
+                        while True:
+                            if self.cancel_operation:
+                                return
+                            
+                            chunk = src.read(HASH_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            sha256.update(chunk)
+                    
+                    source_hash = sha256.hexdigest().upper()
+                    write_hash_sidecar(self.iso_path, source_hash)
+                
+                if not self._check_manifest_hash(source_hash, 0):
+                    return
+                
+                self.iso_hash = source_hash
+                self._install_complete(dest_path)
+                return
+            
             source_size = os.path.getsize(self.iso_path)
             copied = 0
             start_time = time.time()
             last_update = start_time
             
-            self._update_progress(0, "Verifying source ISO...", "")
+            self._update_progress(0, "Copying ISO to install location...", "")
             
-            sha256 = hashlib.sha256()
-            with open(self.iso_path, 'rb') as src:
-                while True:
-                    if self.cancel_operation:
-                        return
+            def on_write(length):
+                nonlocal copied, last_update
+                if self.cancel_operation:
+                    raise CopyCancelled()
+                
+                copied += length
+                now = time.time()
+                if now - last_update >= 0.3:
+                    pct = int((copied / source_size) * 90)
+                    elapsed = now - start_time
+                    speed = copied / elapsed / (1024 * 1024) if elapsed > 0 else 0
                     
-                    chunk = src.read(8192)
-                    if not chunk:
-                        break
-                    sha256.update(chunk)
+                    self._update_progress(
+                        pct,
+                        f"Copying: {int(copied/source_size*100)}%",
+                        f"{speed:.1f} MB/s"
+                    )
+                    last_update = now
             
-            source_hash = sha256.hexdigest().upper()
-            
-            if self.manifest_data and self.manifest_data.get("sha256"):
-                expected = self.manifest_data["sha256"].upper()
-                if is_placeholder_checksum(expected):
-                    self._update_progress(3, "Checksum verification skipped (development mode)", "")
-                elif source_hash != expected:
-                    self._show_error("Checksum Mismatch",
-                                    f"ISO checksum does not match manifest.\n"
-                                    f"Expected: {expected[:16]}...\n"
-                                    f"Got: {source_hash[:16]}...")
-                    return
-            
-            if self.iso_path == dest_path:
-                self.iso_hash = source_hash
-                self._install_complete(dest_path)
+            # The source is hashed as it is copied rather than in a pass of its own
+            sha256 = hashlib.sha256()
+            try:
+                with open(self.iso_path, 'rb') as src:
+                    with open(dest_path, 'wb') as dst:
+                        shutil.copyfileobj(src, HashingWriter(dst, sha256, on_write),
+                                           HASH_CHUNK_SIZE)
+            except CopyCancelled:
+                try:
+                    os.remove(dest_path)
+                except:
+                    pass
                 return
             
-            self._update_progress(5, "Copying ISO to install location...", "")
-            
-            with open(self.iso_path, 'rb') as src:
-                with open(dest_path, 'wb') as dst:
-                    while True:
-                        if self.cancel_operation:
-                            try:
-                                os.remove(dest_path)
-                            except:
-                                pass
-                            return
-                        
-                        chunk = src.read(1024 * 1024)
-                        if not chunk:
-                            break
-                        
-                        dst.write(chunk)
-                        copied += len(chunk)
-                        
-                        now = time.time()
-                        if now - last_update >= 0.3:
-                            pct = 5 + int((copied / source_size) * 85)
-                            elapsed = now - start_time
-                            speed = copied / elapsed / (1024 * 1024) if elapsed > 0 else 0
-                            
-                            self._update_progress(
-                                pct,
-                                f"Copying: {int(copied/source_size*100)}%",
-                                f"{speed:.1f} MB/s"
-                            )
-                            last_update = now
+            source_hash = sha256.hexdigest().upper()
+            if not self._check_manifest_hash(source_hash, 90):
+                try:
+                    os.remove(dest_path)
+                except:
+                    pass
+                return
             
             self._update_progress(92, "Verifying copied file...", "")
             
-            verify_hash = hashlib.sha256()
-            with open(dest_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b''):
-                    verify_hash.update(chunk)
-            
-            dest_hash = verify_hash.hexdigest().upper()
+            dest_hash = self._calculate_sha256(dest_path).upper()
             
-            if dest_hash != source_hash:
+            if not sha256_matches(dest_hash, source_hash):
                 self._show_error("Copy Verification Failed",
                                 "Copied file does not match source. Please try again.")
                 try:
@@ -1040,6 +1366,8 @@ class AegisFreemiumInstaller:
                     pass
                 return
             
+            write_hash_sidecar(self.iso_path, source_hash)
+            write_hash_sidecar(dest_path, dest_hash)
             self.iso_hash = dest_hash
             self._install_complete(dest_path)
             
@@ -1051,32 +1379,80 @@ class AegisFreemiumInstaller:
         except Exception as e:
             self._show_error("Installation Failed", str(e))
     
+    def _check_manifest_hash(self, source_hash, pct):
+        """Compare against the manifest checksum; shows the error and returns False on mismatch"""
+        if self.manifest_data and self.manifest_data.get("sha256"):
+            expected = self.manifest_data["sha256"].upper()
+            if is_placeholder_checksum(expected):
+                # pct is where the bar already stands; the notice shouldn't move it back
+                self._update_progress(pct, "Checksum verification skipped (development mode)", "")
+            elif not sha256_matches(source_hash, expected):
+                self._show_error("Checksum Mismatch",
+                                f"ISO checksum does not match manifest.\n"
+                                f"Expected: {expected[:16]}...\n"
+                                f"Got: {source_hash[:16]}...")
+                return False
+        return True
+    
     def _calculate_sha256(self, filepath):
-        sha256 = hashlib.sha256()
+        # Python 3.11+ hashes the whole file in C without a per-chunk loop
+        if hasattr(hashlib, "file_digest"):
+            with open(filepath, 'rb') as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+        
+        # Older Pythons: the platform's own tool beats a Python read loop
+        native_hash = native_sha256(filepath)
+        if native_hash:
+            return native_hash
+        
         with open(filepath, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
+            sha256 = hashlib.sha256()
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
                 sha256.update(chunk)
         return sha256.hexdigest()
     
     def _update_progress(self, pct, text, speed):
-        def update():
-            self.progress_pct.configure(text=f"{pct}%")
-            self.progress_bar["value"] = pct
-            self.progress_text.configure(text=text)
-            self.progress_speed.configure(text=speed)
+        # The download and copy threads call this on every progress tick; each
+        # call would otherwise queue its own redraw, so only the newest values
+        # are held and the Tk thread picks them up every PROGRESS_UPDATE_INTERVAL_MS
+        with self._progress_lock:
+            self._pending_progress = (pct, text, speed)
+            if self._progress_flush_scheduled:
+                return
+            self._progress_flush_scheduled = True
         
-        self.root.after(0, update)
+        self.root.after(PROGRESS_UPDATE_INTERVAL_MS, self._flush_progress)
+    
+    def _flush_progress(self):
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            self._progress_flush_scheduled = False
+        
+        if pending is None:
+            return
+        pct, text, speed = pending
+        self.progress_pct.configure(text=f"{pct}%")
+        self.progress_bar["value"] = pct
+        self.progress_text.configure(text=text)
+        self.progress_speed.configure(text=speed)
+    
+    def _discard_pending_progress(self):
+        with self._progress_lock:
+            self._pending_progress = None
     
     def _install_complete(self, dest_path):
         def complete():
+            self._discard_pending_progress()
+            self._show_step(3)
             self.final_iso_path_label.configure(text=dest_path)
             self.hash_label.configure(text=str(self.iso_hash or ""))
-            self._show_step(3)
         
         self.root.after(0, complete)
     
     def _show_error(self, title, message):
         def show():
+            self._discard_pending_progress()
             self.progress_pct.configure(text="!", fg="#d32f2f")
             self.progress_text.configure(text=message, fg="#d32f2f")
             self.progress_speed.configure(text="")
@@ -9,6 +9,7 @@ import os
 import sys
 import hashlib
 import threading
+import queue
 import subprocess
 from pathlib import Path
 import time
@@ -17,8 +18,10 @@ import json
 import base64
 import binascii
 import shutil
+import mmap
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, NamedTuple
 import urllib.request
 import urllib.error
 import ssl
@@ -69,6 +72,7 @@ ensure_dependencies()
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 
 from typing import Any
 
@@ -95,51 +99,71 @@ except ImportError:
 
 VERSION = "3.0.0"
 APP_NAME = "Aegis OS Licensed Installer"
+WINDOW_WIDTH = 600
+WINDOW_HEIGHT = 660
 
 ISO_DOWNLOAD_BASE_URL = "https://download.aegis-os.com/iso/licensed"
 ISO_DOWNLOAD_FALLBACK_URL = "https://mirror.aegis-os.com/iso/licensed"
 DEFAULT_DOWNLOAD_DIR = Path.home() / "Downloads" / "AegisOS"
+COPY_BUFFER_SIZE = 16 * 1024 * 1024
+LICENSE_CACHE_SIZE = 8
+HASH_SIDECAR_SUFFIX = ".aegishash"
+PROGRESS_UPDATE_INTERVAL_MS = 100
+MMAP_HASH_WINDOW = 64 * 1024 * 1024
+MMAP_HASH_MAX_SIZE = 2 * 1024 * 1024 * 1024
+
+
+class Edition(NamedTuple):
+    """One licensed edition; immutable and attribute-accessed"""
+    name: str
+    prefix: str
+    price: str
+    size_gb: float
+    kernel: str
+    features: Tuple[str, ...]
+    iso_filename: str
+
 
 EDITIONS = {
-    "basic": {
-        "name": "Aegis OS Basic",
-        "prefix": "BSIC",
-        "price": "$69 Lifetime",
-        "size_gb": 5.0,
-        "kernel": "linux",
-        "features": [
+    "basic": Edition(
+        name="Aegis OS Basic",
+        prefix="BSIC",
+        price="$69 Lifetime",
+        size_gb=5.0,
+        kernel="linux",
+        features=(
             "Arch Linux Rolling Release",
             "XFCE Desktop (Windows-style)",
-            "VS Code & Development Tools", 
+            "VS Code & Development Tools",
             "Docker Container Support",
             "Advanced Security Suite",
             "24/7 Email Support"
-        ],
-        "iso_filename": "aegis-basic.iso"
-    },
-    "workplace": {
-        "name": "Aegis OS Workplace",
-        "prefix": "WORK",
-        "price": "$49 Lifetime",
-        "size_gb": 5.5,
-        "kernel": "linux-lts",
-        "features": [
+        ),
+        iso_filename="aegis-basic.iso"
+    ),
+    "workplace": Edition(
+        name="Aegis OS Workplace",
+        prefix="WORK",
+        price="$49 Lifetime",
+        size_gb=5.5,
+        kernel="linux-lts",
+        features=(
             "LTS Kernel (Stability)",
             "LibreOffice Suite",
             "Video Conferencing",
             "VPN & Remote Desktop",
             "Document Management",
             "Enterprise Security"
-        ],
-        "iso_filename": "aegis-workplace.iso"
-    },
-    "gamer": {
-        "name": "Aegis OS Gamer",
-        "prefix": "GAME",
-        "price": "$49 Lifetime",
-        "size_gb": 6.5,
-        "kernel": "linux-zen",
-        "features": [
+        ),
+        iso_filename="aegis-workplace.iso"
+    ),
+    "gamer": Edition(
+        name="Aegis OS Gamer",
+        prefix="GAME",
+        price="$49 Lifetime",
+        size_gb=6.5,
+        kernel="linux-zen",
+        features=(
             "linux-zen Gaming Kernel",
             "Steam + Lutris Pre-installed",
             "Proton/Wine + GameScope",
@@ -148,57 +172,57 @@ EDITIONS = {
             "Controller Support",
             "OBS Streaming Studio",
             "Low-latency PipeWire Audio"
-        ],
-        "iso_filename": "aegis-gamer.iso"
-    },
-    "aidev": {
-        "name": "Aegis OS AI Developer",
-        "prefix": "AIDV",
-        "price": "$89 Lifetime",
-        "size_gb": 8.0,
-        "kernel": "linux",
-        "features": [
+        ),
+        iso_filename="aegis-gamer.iso"
+    ),
+    "aidev": Edition(
+        name="Aegis OS AI Developer",
+        prefix="AIDV",
+        price="$89 Lifetime",
+        size_gb=8.0,
+        kernel="linux",
+        features=(
             "CUDA & cuDNN Pre-configured",
             "PyTorch & TensorFlow Ready",
             "JupyterLab & VS Code",
             "Docker & Kubernetes",
             "GPU Monitoring (nvtop)",
             "Developer Support"
-        ],
-        "iso_filename": "aegis-aidev.iso"
-    },
-    "gamer_ai": {
-        "name": "Aegis OS Gamer + AI",
-        "prefix": "GMAI",
-        "price": "$129 Lifetime",
-        "size_gb": 10.0,
-        "kernel": "linux-zen",
-        "features": [
+        ),
+        iso_filename="aegis-aidev.iso"
+    ),
+    "gamer_ai": Edition(
+        name="Aegis OS Gamer + AI",
+        prefix="GMAI",
+        price="$129 Lifetime",
+        size_gb=10.0,
+        kernel="linux-zen",
+        features=(
             "All Gamer Features",
             "All AI Developer Features",
             "AI-Powered Upscaling",
             "Neural Game Enhancement",
             "ML Streaming Tools",
             "Priority Support"
-        ],
-        "iso_filename": "aegis-gamer-ai.iso"
-    },
-    "server": {
-        "name": "Aegis OS Server",
-        "prefix": "SERV",
-        "price": "$129 Lifetime",
-        "size_gb": 4.0,
-        "kernel": "linux-lts",
-        "features": [
+        ),
+        iso_filename="aegis-gamer-ai.iso"
+    ),
+    "server": Edition(
+        name="Aegis OS Server",
+        prefix="SERV",
+        price="$129 Lifetime",
+        size_gb=4.0,
+        kernel="linux-lts",
+        features=(
             "LTS Kernel (Stability)",
             "Headless Server Mode",
             "Docker & Kubernetes",
             "PostgreSQL & Redis",
             "Prometheus & Grafana",
             "Enterprise SLA"
-        ],
-        "iso_filename": "aegis-server.iso"
-    }
+        ),
+        iso_filename="aegis-server.iso"
+    )
 }
 
 RSA_PUBLIC_KEY_PEM = """-----BEGIN PUBLIC KEY-----
@@ -224,6 +248,39 @@ def is_placeholder_checksum(checksum):
     return False
 
 
+def read_hash_sidecar(path):
+    """Return the SHA-256 recorded next to path if the file is unchanged since"""
+    try:
+        st = os.stat(path)
+        with open(str(path) + HASH_SIDECAR_SUFFIX, 'r') as f:
+            cached = json.load(f)
+        if cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+            return cached.get("sha256")
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+
+def write_hash_sidecar(path, sha256_hash):
+    """Record the SHA-256 of path in a side-car file (skipped on read-only media)"""
+    sidecar = str(path) + HASH_SIDECAR_SUFFIX
+    temp_path = sidecar + ".tmp"
+    try:
+        st = os.stat(path)
+        with open(temp_path, 'w') as f:
+            json.dump({
+                "sha256": sha256_hash,
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size
+            }, f)
+        os.replace(temp_path, sidecar)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
 class OfflineISOLocator:
     """Handles offline ISO detection from local sources"""
     
@@ -328,7 +385,7 @@ class OfflineISOLocator:
         
         manifest, manifest_path = OfflineISOLocator.load_manifest(search_paths)
         expected_sha256 = None
-        expected_filename = edition.get("iso_filename")
+        expected_filename = edition.iso_filename
         
         if manifest and "editions" in manifest:
             edition_data = manifest["editions"].get(edition_id, {})
@@ -385,6 +442,7 @@ class RSALicenseValidator:
     def __init__(self, public_key_pem=RSA_PUBLIC_KEY_PEM):
         self.public_key_pem = public_key_pem
         self.public_key = None
+        self._validation_cache = OrderedDict()
         
         if CRYPTO_AVAILABLE:
             try:
@@ -452,7 +510,7 @@ class RSALicenseValidator:
         if edition_id not in EDITIONS:
             return False, None, None, f"Unknown edition: {edition_id}"
         
-        edition_name = EDITIONS[edition_id]["name"]
+        edition_name = EDITIONS[edition_id].name
         
         expiry = license_data.get("expiry_date")
         if expiry:
@@ -497,6 +555,36 @@ class RSALicenseValidator:
         except Exception as e:
             return False, None, None, f"Signature verification failed: {str(e)}"
     
+    def load_and_verify(self, license_path):
+        """
+        Load and verify a license file, reusing the previous result while
+        the file's path, mtime and size are unchanged
+        
+        Returns: (license_data, valid, edition_id, edition_name, message)
+        """
+        try:
+            st = os.stat(license_path)
+            cache_key = (license_path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            cache_key = None
+        
+        if cache_key in self._validation_cache:
+            self._validation_cache.move_to_end(cache_key)
+            return self._validation_cache[cache_key]
+        
+        license_data = self.load_license(license_path)
+        if not license_data:
+            result = (None, False, None, None, "Failed to parse license file")
+        else:
+            result = (license_data,) + self.verify_license(license_data)
+        
+        if cache_key is not None:
+            self._validation_cache[cache_key] = result
+            if len(self._validation_cache) > LICENSE_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+        
+        return result
+    
     def validate_from_file(self, license_path=None):
         """Convenience method to validate from file"""
         if not license_path:
@@ -652,6 +740,12 @@ class ISODownloader:
             
             mode = 'ab' if existing_size > 0 and response.status == 206 else 'wb'
             
+            # Hash while writing so the finished file is not read back again;
+            # a resumed download only needs its existing prefix hashed first
+            sha256 = hashlib.sha256()
+            if mode == 'ab' and not self._hash_into(partial_path, sha256):
+                return False, "Download cancelled by user", None
+            
             with open(partial_path, mode) as f:
                 while True:
                     if self.cancelled:
@@ -662,6 +756,7 @@ class ISODownloader:
                         break
                     
                     f.write(chunk)
+                    sha256.update(chunk)
                     downloaded += len(chunk)
                     
                     now = time.time()
@@ -705,7 +800,8 @@ class ISODownloader:
             
             partial_path.rename(destination)
             
-            return self._verify_download(destination, expected_sha256)
+            return self._verify_download(destination, expected_sha256,
+                                         sha256.hexdigest().upper())
             
         except urllib.error.URLError as e:
             if hasattr(e, 'reason'):
@@ -716,27 +812,32 @@ class ISODownloader:
         except Exception as e:
             return False, f"Download failed: {str(e)}", None
     
-    def _verify_download(self, filepath, expected_sha256):
-        """Verify downloaded file checksum"""
-        if self.progress_callback:
-            self.progress_callback(99, "Verifying checksum...", "")
-        
-        sha256 = hashlib.sha256()
-        file_size = Path(filepath).stat().st_size
-        processed = 0
+    def _hash_into(self, filepath, sha256):
+        """Feed a file into sha256; returns False if cancelled part way"""
+        buf = bytearray(1024 * 1024)
+        view = memoryview(buf)
         
         with open(filepath, 'rb') as f:
             while True:
                 if self.cancelled:
-                    return False, "Verification cancelled", None
+                    return False
                 
-                chunk = f.read(8192)
-                if not chunk:
+                n = f.readinto(buf)
+                if not n:
                     break
-                sha256.update(chunk)
-                processed += len(chunk)
+                sha256.update(view[:n])
+        return True
+    
+    def _verify_download(self, filepath, expected_sha256, actual_hash=None):
+        """Verify downloaded file checksum"""
+        if self.progress_callback:
+            self.progress_callback(99, "Verifying checksum...", "")
         
-        actual_hash = sha256.hexdigest().upper()
+        if actual_hash is None:
+            sha256 = hashlib.sha256()
+            if not self._hash_into(filepath, sha256):
+                return False, "Verification cancelled", None
+            actual_hash = sha256.hexdigest().upper()
         
         if expected_sha256:
             expected = expected_sha256.upper()
@@ -744,14 +845,16 @@ class ISODownloader:
                 Path(filepath).unlink(missing_ok=True)
                 return False, f"Checksum mismatch!\nExpected: {expected[:16]}...\nGot: {actual_hash[:16]}...", None
         
+        write_hash_sidecar(filepath, actual_hash)
         return True, "Download completed successfully", actual_hash
 
 
 class AegisLicensedInstaller:
     def __init__(self):
         self.root = tk.Tk()
+        self.root.withdraw()
         self.root.title(APP_NAME)
-        self.root.geometry("600x660")
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.resizable(False, False)
         self.root.configure(bg="#f0f0f0")
         
@@ -770,11 +873,28 @@ class AegisLicensedInstaller:
         self.validated_edition_id = None
         self.validated_edition_name = None
         
+        self._step2_built = False
+        self._step3_built = False
+        
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._progress_flush_scheduled = False
+        
+        self._setup_fonts()
         self._setup_styles()
         self._create_ui()
         self._center_window()
+        self.root.deiconify()
         self._scan_for_license()
     
+    def _setup_fonts(self):
+        # Shared font objects, so Tk does not re-resolve the same tuple per widget
+        self.font_body = tkfont.Font(family="Segoe UI", size=10)
+        self.font_bold = tkfont.Font(family="Segoe UI", size=10, weight="bold")
+        self.font_large = tkfont.Font(family="Segoe UI", size=11)
+        self.font_title = tkfont.Font(family="Segoe UI", size=12, weight="bold")
+        self.font_mono = tkfont.Font(family="Consolas", size=9)
+    
     def _setup_styles(self):
         style = ttk.Style()
         style.theme_use('clam')
@@ -783,36 +903,35 @@ class AegisLicensedInstaller:
         style.configure("Header.TLabel", background="#005A9E", foreground="white",
                        font=("Segoe UI", 18, "bold"))
         style.configure("HeaderSub.TLabel", background="#005A9E", foreground="#E0E0E0",
-                       font=("Segoe UI", 11))
+                       font=self.font_large)
         
         style.configure("Section.TFrame", background="white", relief="solid", borderwidth=1)
-        style.configure("Section.TLabel", background="white", font=("Segoe UI", 10))
+        style.configure("Section.TLabel", background="white", font=self.font_body)
         style.configure("SectionTitle.TLabel", background="white", foreground="#005A9E",
-                       font=("Segoe UI", 12, "bold"))
+                       font=self.font_title)
         
         style.configure("Valid.TLabel", background="white", foreground="#28a745",
-                       font=("Segoe UI", 10))
+                       font=self.font_body)
         style.configure("Invalid.TLabel", background="white", foreground="#dc3545",
-                       font=("Segoe UI", 10))
+                       font=self.font_body)
         
         style.configure("Progress.TLabel", background="white", font=("Segoe UI", 36, "bold"),
                        foreground="#005A9E")
         style.configure("Success.TLabel", background="white", font=("Segoe UI", 16),
                        foreground="#005A9E")
         
-        style.configure("Primary.TButton", font=("Segoe UI", 10, "bold"))
-        style.configure("TButton", font=("Segoe UI", 10))
+        style.configure("Primary.TButton", font=self.font_bold)
+        style.configure("TButton", font=self.font_body)
         
         style.configure("Blue.Horizontal.TProgressbar", troughcolor="#ddd",
                        background="#005A9E", thickness=8)
     
     def _center_window(self):
+        # The window is still withdrawn here, so winfo_width() would report 1
         self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f"{width}x{height}+{x}+{y}")
+        x = (self.root.winfo_screenwidth() // 2) - (WINDOW_WIDTH // 2)
+        y = (self.root.winfo_screenheight() // 2) - (WINDOW_HEIGHT // 2)
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
     
     def _create_ui(self):
         header = tk.Frame(self.root, bg="#005A9E", height=80)
@@ -831,7 +950,7 @@ class AegisLicensedInstaller:
         base_label.pack()
         
         subtitle = tk.Label(header_inner, text="Offline Installer with RSA License Verification",
-                           font=("Segoe UI", 11), bg="#005A9E", fg="#E0E0E0")
+                           font=self.font_large, bg="#005A9E", fg="#E0E0E0")
         subtitle.pack()
         
         self.content = tk.Frame(self.root, bg="#f0f0f0")
@@ -842,8 +961,6 @@ class AegisLicensedInstaller:
         self.step3_frame = tk.Frame(self.content, bg="#f0f0f0")
         
         self._create_step1()
-        self._create_step2()
-        self._create_step3()
         
         footer = tk.Frame(self.root, bg="#e0e0e0", height=55)
         footer.pack(fill="x", side="bottom")
@@ -862,6 +979,21 @@ class AegisLicensedInstaller:
         
         self._show_step(1)
     
+    def _wrap_to_width(self, label, container=None):
+        """Keep a path label's wraplength matched to the space it is given.
+        
+        The width only changes on layout, so this replaces a fixed wraplength
+        with one update per <Configure> rather than per text change.
+        """
+        container = container or label
+        
+        def on_configure(event):
+            width = max(event.width - 20, 1)
+            if str(label.cget("wraplength")) != str(width):
+                label.configure(wraplength=width)
+        
+        container.bind("<Configure>", on_configure)
+    
     def _create_section(self, parent, title):
         frame = tk.Frame(parent, bg="white", bd=1, relief="solid")
         frame.pack(fill="x", pady=5)
@@ -870,7 +1002,7 @@ class AegisLicensedInstaller:
         inner.pack(fill="both", padx=15, pady=12)
         
         if title:
-            lbl = tk.Label(inner, text=title, font=("Segoe UI", 12, "bold"),
+            lbl = tk.Label(inner, text=title, font=self.font_title,
                           bg="white", fg="#005A9E")
             lbl.pack(anchor="w")
         
@@ -880,13 +1012,14 @@ class AegisLicensedInstaller:
         license_section = self._create_section(self.step1_frame, "License File (RSA-2048 Verified)")
         
         self.license_status_label = tk.Label(license_section, text="Scanning for license...",
-                                            font=("Segoe UI", 10), bg="white", fg="#888888")
+                                            font=self.font_body, bg="white", fg="#888888")
         self.license_status_label.pack(anchor="w", pady=(5, 0))
         
         self.license_path_label = tk.Label(license_section, text="",
-                                          font=("Consolas", 9), bg="#f5f5f5",
-                                          wraplength=450, justify="left")
+                                          font=self.font_mono, bg="#f5f5f5",
+                                          justify="left")
         self.license_path_label.pack(fill="x", padx=0, pady=(5, 5))
+        self._wrap_to_width(self.license_path_label)
         
         btn_frame = tk.Frame(license_section, bg="white")
         btn_frame.pack(anchor="w", pady=(0, 5))
@@ -906,22 +1039,26 @@ class AegisLicensedInstaller:
         
         self.edition_name_label = tk.Label(self.edition_info_frame,
                                           text="No valid license detected",
-                                          font=("Segoe UI", 11), bg="white", fg="#888888")
+                                          font=self.font_large, bg="white", fg="#888888")
         self.edition_name_label.pack(anchor="w")
         
         self.features_frame = tk.Frame(edition_section, bg="white")
         self.features_frame.pack(fill="x", pady=(8, 0))
+        self.kernel_frame = None
+        self.kernel_label = None
+        self.feature_rows = []
         
         self.iso_section = self._create_section(self.step1_frame, "ISO Source")
         
         self.iso_status_label = tk.Label(self.iso_section, text="Validate license first",
-                                        font=("Segoe UI", 10), bg="white", fg="#888888")
+                                        font=self.font_body, bg="white", fg="#888888")
         self.iso_status_label.pack(anchor="w", pady=(5, 0))
         
         self.iso_path_label = tk.Label(self.iso_section, text="",
-                                      font=("Consolas", 9), bg="#f5f5f5",
-                                      wraplength=450, justify="left")
+                                      font=self.font_mono, bg="#f5f5f5",
+                                      justify="left")
         self.iso_path_label.pack(fill="x", padx=0, pady=(5, 5))
+        self._wrap_to_width(self.iso_path_label)
         
         iso_btn_frame = tk.Frame(self.iso_section, bg="white")
         iso_btn_frame.pack(anchor="w", pady=(0, 5))
@@ -942,9 +1079,10 @@ class AegisLicensedInstaller:
         path_frame.pack(fill="x", pady=(8, 5))
         
         self.folder_label = tk.Label(path_frame, text=self.install_folder,
-                                    font=("Consolas", 9), bg="#f5f5f5",
-                                    wraplength=450, justify="left")
+                                    font=self.font_mono, bg="#f5f5f5",
+                                    justify="left")
         self.folder_label.pack(padx=8, pady=6, anchor="w")
+        self._wrap_to_width(self.folder_label, path_frame)
         
         btn_browse = ttk.Button(folder_section, text="Change Folder",
                                command=self._browse_folder)
@@ -966,11 +1104,11 @@ class AegisLicensedInstaller:
         self.progress_bar.pack(pady=10)
         
         self.progress_text = tk.Label(center_frame, text="Preparing...",
-                                     font=("Segoe UI", 11), bg="white", fg="#666666")
+                                     font=self.font_large, bg="white", fg="#666666")
         self.progress_text.pack()
         
         self.progress_speed = tk.Label(center_frame, text="",
-                                      font=("Segoe UI", 10), bg="white", fg="#888888")
+                                      font=self.font_body, bg="white", fg="#888888")
         self.progress_speed.pack(pady=(5, 0))
     
     def _create_step3(self):
@@ -987,22 +1125,23 @@ class AegisLicensedInstaller:
         self.final_edition_label.pack(anchor="w", pady=(5, 0))
         
         self.final_license_label = tk.Label(license_section, text="",
-                                           font=("Consolas", 9), bg="#f5f5f5")
+                                           font=self.font_mono, bg="#f5f5f5")
         self.final_license_label.pack(fill="x", padx=0, pady=(5, 0))
         
         path_section = self._create_section(self.step3_frame, "ISO File")
         
         self.final_iso_path_label = tk.Label(path_section, text="",
-                                            font=("Consolas", 9), bg="#f5f5f5",
-                                            wraplength=500, justify="left")
+                                            font=self.font_mono, bg="#f5f5f5",
+                                            justify="left")
         self.final_iso_path_label.pack(fill="x", padx=8, pady=6)
+        self._wrap_to_width(self.final_iso_path_label)
         
         next_section = self._create_section(self.step3_frame, "Next: Create Bootable USB")
         
         step1_frame = tk.Frame(next_section, bg="white")
         step1_frame.pack(anchor="w", pady=2)
         
-        tk.Label(step1_frame, text="1. Use ", font=("Segoe UI", 10), bg="white").pack(side="left")
+        tk.Label(step1_frame, text="1. Use ", font=self.font_body, bg="white").pack(side="left")
         
         etcher_link = tk.Label(step1_frame, text="Balena Etcher",
                               font=("Segoe UI", 10, "underline"),
@@ -1010,12 +1149,20 @@ class AegisLicensedInstaller:
         etcher_link.pack(side="left")
         etcher_link.bind("<Button-1>", lambda e: self._open_etcher())
         
-        tk.Label(step1_frame, text=" or similar tool", font=("Segoe UI", 10), bg="white").pack(side="left")
+        tk.Label(step1_frame, text=" or similar tool", font=self.font_body, bg="white").pack(side="left")
         
         tk.Label(next_section, text="2. Select ISO, select USB, click Flash",
-                font=("Segoe UI", 10), bg="white").pack(anchor="w", pady=2)
+                font=self.font_body, bg="white").pack(anchor="w", pady=2)
     
     def _show_step(self, step):
+        # Progress and completion pages are only built once they are needed
+        if step == 2 and not self._step2_built:
+            self._create_step2()
+            self._step2_built = True
+        elif step == 3 and not self._step3_built:
+            self._create_step3()
+            self._step3_built = True
+        
         self.step1_frame.pack_forget()
         self.step2_frame.pack_forget()
         self.step3_frame.pack_forget()
@@ -1037,10 +1184,16 @@ class AegisLicensedInstaller:
         """Scan for license file and validate"""
         self.license_status_label.configure(text="Scanning for license...", fg="#888888")
         self.license_path_label.configure(text="")
-        self.root.update()
+        self.btn_rescan.configure(state="disabled")
         
+        threading.Thread(target=self._scan_license_worker, daemon=True).start()
+    
+    def _scan_license_worker(self):
+        """Background worker for the license file search"""
         license_path = self.license_validator.find_license_file()
-        
+        self.root.after(0, lambda: self._scan_license_done(license_path))
+    
+    def _scan_license_done(self, license_path):
         if license_path:
             self.license_path = license_path
             self.license_path_label.configure(text=license_path)
@@ -1052,6 +1205,7 @@ class AegisLicensedInstaller:
                 fg="#dc3545"
             )
             self.btn_start.configure(state="disabled")
+            self.btn_rescan.configure(state="normal")
             self._clear_edition_features()
     
     def _validate_license(self):
@@ -1059,17 +1213,37 @@ class AegisLicensedInstaller:
         if not self.license_path:
             return
         
-        self.license_data = self.license_validator.load_license(self.license_path)
+        self.license_status_label.configure(text="Validating license...", fg="#888888")
+        self.btn_rescan.configure(state="disabled")
+        
+        threading.Thread(
+            target=self._validate_license_worker,
+            args=(self.license_path,),
+            daemon=True
+        ).start()
+    
+    def _validate_license_worker(self, license_path):
+        """Background worker for license signature verification"""
+        result = self.license_validator.load_and_verify(license_path)
+        self.root.after(0, lambda: self._validate_license_done(license_path, result))
+    
+    def _validate_license_done(self, license_path, result):
+        self.btn_rescan.configure(state="normal")
+        
+        # A newer license was picked while this one was being verified
+        if license_path != self.license_path:
+            return
+        
+        self.license_data, valid, edition_id, edition_name, message = result
+        
         if not self.license_data:
             self.license_status_label.configure(
-                text="✗ Failed to parse license file",
+                text=f"✗ {message}",
                 fg="#dc3545"
             )
             self.btn_start.configure(state="disabled")
             return
         
-        valid, edition_id, edition_name, message = self.license_validator.verify_license(self.license_data)
-        
         if valid:
             self.validated_edition_id = edition_id
             self.validated_edition_name = edition_name
@@ -1100,9 +1274,25 @@ class AegisLicensedInstaller:
         self.iso_path_label.configure(text="")
         self.btn_browse_iso.pack_forget()
         self.btn_download_iso.pack_forget()
-        self.root.update()
+        self.btn_start.configure(state="disabled")
+        
+        threading.Thread(
+            target=self._scan_iso_worker,
+            args=(self.validated_edition_id,),
+            daemon=True
+        ).start()
+    
+    def _scan_iso_worker(self, edition_id):
+        """Background worker for the offline ISO search"""
+        result = OfflineISOLocator.find_iso(edition_id)
+        self.root.after(0, lambda: self._scan_iso_done(edition_id, result))
+    
+    def _scan_iso_done(self, edition_id, result):
+        # The license changed edition while the scan was running
+        if edition_id != self.validated_edition_id:
+            return
         
-        iso_path, manifest_data, source = OfflineISOLocator.find_iso(self.validated_edition_id)
+        iso_path, manifest_data, source = result
         
         if iso_path:
             self.iso_path = iso_path
@@ -1170,7 +1360,7 @@ class AegisLicensedInstaller:
         if not download_dir:
             download_dir = str(DEFAULT_DOWNLOAD_DIR)
         
-        iso_filename = edition.get("iso_filename", f"aegis-{self.validated_edition_id}.iso")
+        iso_filename = edition.iso_filename
         destination = os.path.join(download_dir, iso_filename)
         
         if os.path.exists(destination):
@@ -1230,19 +1420,21 @@ class AegisLicensedInstaller:
     def _download_complete(self, dest_path, sha256_hash):
         """Handle successful download completion"""
         def complete():
+            self._discard_pending_progress()
+            self._show_step(3)
             edition_name = self.validated_edition_name or "Unknown Edition"
             self.final_edition_label.configure(text=edition_name)
             if self.license_data:
                 license_key = self.license_data.get('license_key', 'N/A') if self.license_data else 'N/A'
                 self.final_license_label.configure(text=f"Key: {license_key}")
             self.final_iso_path_label.configure(text=dest_path)
-            self._show_step(3)
         
         self.root.after(0, complete)
     
     def _show_download_error(self, message):
         """Show download error and allow retry"""
         def show():
+            self._discard_pending_progress()
             self.progress_pct.configure(text="!", fg="#d32f2f")
             self.progress_text.configure(text=message, fg="#d32f2f")
             self.progress_speed.configure(text="")
@@ -1264,7 +1456,7 @@ class AegisLicensedInstaller:
             return
         
         download_dir = str(DEFAULT_DOWNLOAD_DIR)
-        iso_filename = edition.get("iso_filename", f"aegis-{self.validated_edition_id}.iso")
+        iso_filename = edition.iso_filename
         destination = os.path.join(download_dir, iso_filename)
         
         self.cancel_operation = False
@@ -1300,7 +1492,7 @@ class AegisLicensedInstaller:
         if not edition:
             return
         
-        kernel = edition.get("kernel", "linux")
+        kernel = edition.kernel
         kernel_label = {
             "linux": "Standard Kernel",
             "linux-zen": "Gaming Kernel (linux-zen)",
@@ -1308,40 +1500,54 @@ class AegisLicensedInstaller:
         }.get(kernel, kernel)
         
         self.edition_name_label.configure(
-            text=f"{edition['name']} ({edition['price']})",
+            text=f"{edition.name} ({edition.price})",
             fg="#005A9E"
         )
         
-        for widget in self.features_frame.winfo_children():
-            widget.destroy()
+        # Rows are kept and re-packed in order rather than destroyed on every
+        # license change
+        self._hide_edition_features()
         
-        kernel_frame = tk.Frame(self.features_frame, bg="#e8f4fc")
-        kernel_frame.pack(anchor="w", pady=(0, 5), fill="x")
-        
-        kernel_icon = tk.Label(kernel_frame, text="🐧", font=("Segoe UI", 10),
-                              bg="#e8f4fc")
-        kernel_icon.pack(side="left", padx=(5, 2))
+        if self.kernel_frame is None:
+            self.kernel_frame = tk.Frame(self.features_frame, bg="#e8f4fc")
+            
+            kernel_icon = tk.Label(self.kernel_frame, text="🐧", font=self.font_body,
+                                  bg="#e8f4fc")
+            kernel_icon.pack(side="left", padx=(5, 2))
+            
+            self.kernel_label = tk.Label(self.kernel_frame, font=("Segoe UI", 9, "bold"),
+                                         bg="#e8f4fc", fg="#0066cc")
+            self.kernel_label.pack(side="left", pady=3)
         
-        kernel_lbl = tk.Label(kernel_frame, text=f"Arch Linux • {kernel_label}",
-                             font=("Segoe UI", 9, "bold"), bg="#e8f4fc", fg="#0066cc")
-        kernel_lbl.pack(side="left", pady=3)
+        self.kernel_label.configure(text=f"Arch Linux • {kernel_label}")
+        self.kernel_frame.pack(anchor="w", pady=(0, 5), fill="x")
         
-        for feature in edition["features"]:
-            f_frame = tk.Frame(self.features_frame, bg="white")
-            f_frame.pack(anchor="w", pady=1)
-            
-            check = tk.Label(f_frame, text="✓", font=("Segoe UI", 10, "bold"),
-                           bg="white", fg="#005A9E")
-            check.pack(side="left")
+        for index, feature in enumerate(edition.features):
+            if index == len(self.feature_rows):
+                f_frame = tk.Frame(self.features_frame, bg="white")
+                
+                check = tk.Label(f_frame, text="✓", font=self.font_bold,
+                               bg="white", fg="#005A9E")
+                check.pack(side="left")
+                
+                lbl = tk.Label(f_frame, font=("Segoe UI", 9), bg="white")
+                lbl.pack(side="left")
+                self.feature_rows.append((f_frame, lbl))
             
-            lbl = tk.Label(f_frame, text=f" {feature}", font=("Segoe UI", 9), bg="white")
-            lbl.pack(side="left")
+            f_frame, lbl = self.feature_rows[index]
+            lbl.configure(text=f" {feature}")
+            f_frame.pack(anchor="w", pady=1)
+    
+    def _hide_edition_features(self):
+        if self.kernel_frame is not None:
+            self.kernel_frame.pack_forget()
+        for f_frame, _ in self.feature_rows:
+            f_frame.pack_forget()
     
     def _clear_edition_features(self):
         self.edition_name_label.configure(text="No valid license detected", fg="#888888")
         
-        for widget in self.features_frame.winfo_children():
-            widget.destroy()
+        self._hide_edition_features()
         
         self.iso_status_label.configure(text="Validate license first", fg="#888888")
         self.iso_path_label.configure(text="")
@@ -1424,7 +1630,7 @@ class AegisLicensedInstaller:
             self._show_error("Activation Error", str(e))
     
     def _install_worker(self):
-        """Copy ISO to install location with verification"""
+        """Copy ISO to install location, hashing it in the same pass"""
         try:
             os.makedirs(self.install_folder, exist_ok=True)
             
@@ -1435,51 +1641,65 @@ class AegisLicensedInstaller:
             start_time = time.time()
             last_update = start_time
             
-            self._update_progress(0, "Verifying source ISO...", "")
-            
-            sha256 = hashlib.sha256()
-            with open(self.iso_path, 'rb') as src:
-                while True:
-                    if self.cancel_operation:
-                        return
-                    
-                    chunk = src.read(8192)
-                    if not chunk:
-                        break
-                    sha256.update(chunk)
-            
-            source_hash = sha256.hexdigest().upper()
-            
-            if hasattr(self, 'manifest_data') and self.manifest_data and self.manifest_data.get("sha256"):
+            expected = None
+            if self.manifest_data and self.manifest_data.get("sha256"):
                 expected = self.manifest_data["sha256"].upper()
                 if is_placeholder_checksum(expected):
-                    self._update_progress(8, "Checksum verification skipped (development mode)", "")
-                elif source_hash != expected:
-                    self._show_error("Checksum Mismatch",
-                                    f"ISO checksum does not match manifest.\n"
-                                    f"Expected: {expected[:16]}...\n"
-                                    f"Got: {source_hash[:16]}...")
-                    return
+                    self._update_progress(0, "Checksum verification skipped (development mode)", "")
+                    expected = None
             
             if self.iso_path == dest_path:
+                self._update_progress(0, "Verifying ISO...", "")
+                
+                source_hash = self._hash_file(self.iso_path)
+                if source_hash is None:
+                    return
+                
+                if expected and source_hash != expected:
+                    self._show_checksum_mismatch(expected, source_hash)
+                    return
+                
                 self.iso_hash = source_hash
                 self._install_complete(dest_path)
                 return
             
-            self._update_progress(5, "Copying ISO to install location...", "")
+            cached_hash = read_hash_sidecar(self.iso_path)
+            if cached_hash and expected and cached_hash != expected:
+                self._show_checksum_mismatch(expected, cached_hash)
+                return
+            
+            self._update_progress(0, "Copying ISO to install location...", "")
+            
+            stop_reading = threading.Event()
+            read_errors = []
+            hash_queue = queue.Queue(maxsize=2)
+            write_queue = queue.Queue(maxsize=2)
+            
+            sha256 = hashlib.sha256()
+            hasher = None
+            chunk_queues = (write_queue,)
+            if not cached_hash:
+                chunk_queues = (hash_queue, write_queue)
+                hasher = threading.Thread(
+                    target=self._hash_chunks,
+                    args=(hash_queue, sha256),
+                    daemon=True
+                )
+                hasher.start()
+            
+            reader = threading.Thread(
+                target=self._read_chunks,
+                args=(self.iso_path, chunk_queues, stop_reading, read_errors),
+                daemon=True
+            )
+            reader.start()
             
-            with open(self.iso_path, 'rb') as src:
+            chunk = b''
+            try:
                 with open(dest_path, 'wb') as dst:
                     while True:
-                        if self.cancel_operation:
-                            try:
-                                os.remove(dest_path)
-                            except:
-                                pass
-                            return
-                        
-                        chunk = src.read(1024 * 1024)
-                        if not chunk:
+                        chunk = write_queue.get()
+                        if chunk is None:
                             break
                         
                         dst.write(chunk)
@@ -1487,7 +1707,7 @@ class AegisLicensedInstaller:
                         
                         now = time.time()
                         if now - last_update >= 0.3:
-                            pct = 5 + int((copied / source_size) * 85)
+                            pct = int((copied / source_size) * 95)
                             elapsed = now - start_time
                             speed = copied / elapsed / (1024 * 1024) if elapsed > 0 else 0
                             
@@ -1497,17 +1717,36 @@ class AegisLicensedInstaller:
                                 f"{speed:.1f} MB/s"
                             )
                             last_update = now
+            finally:
+                stop_reading.set()
+                while chunk is not None:
+                    chunk = write_queue.get()
+                if hasher:
+                    hasher.join()
             
-            self._update_progress(92, "Verifying copied file...", "")
+            if self.cancel_operation:
+                try:
+                    os.remove(dest_path)
+                except:
+                    pass
+                return
             
-            verify_hash = hashlib.sha256()
-            with open(dest_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b''):
-                    verify_hash.update(chunk)
+            if read_errors:
+                raise read_errors[0]
             
-            dest_hash = verify_hash.hexdigest().upper()
+            self._update_progress(97, "Verifying copied file...", "")
             
-            if dest_hash != source_hash:
+            source_hash = cached_hash or sha256.hexdigest().upper()
+            
+            if expected and source_hash != expected:
+                try:
+                    os.remove(dest_path)
+                except:
+                    pass
+                self._show_checksum_mismatch(expected, source_hash)
+                return
+            
+            if os.path.getsize(dest_path) != copied:
                 self._show_error("Copy Verification Failed",
                                 "Copied file does not match source. Please try again.")
                 try:
@@ -1516,7 +1755,11 @@ class AegisLicensedInstaller:
                     pass
                 return
             
-            self.iso_hash = dest_hash
+            if not cached_hash:
+                write_hash_sidecar(self.iso_path, source_hash)
+            write_hash_sidecar(dest_path, source_hash)
+            
+            self.iso_hash = source_hash
             self._install_complete(dest_path)
             
         except PermissionError:
@@ -1527,29 +1770,125 @@ class AegisLicensedInstaller:
         except Exception as e:
             self._show_error("Installation Failed", str(e))
     
+    def _hash_file(self, path):
+        """SHA-256 of path, taken from its side-car when the file is unchanged"""
+        cached_hash = read_hash_sidecar(path)
+        if cached_hash:
+            return cached_hash
+        
+        # Files under MMAP_HASH_MAX_SIZE are mapped and hashed in large windows.
+        # Larger ones, and any file the platform can't map, are read instead:
+        # a failing drive then raises OSError rather than SIGBUS through the map
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            mm = None
+            if 0 < size < MMAP_HASH_MAX_SIZE:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError, OverflowError):
+                    pass
+            
+            if mm is not None:
+                with mm, memoryview(mm) as view:
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    for offset in range(0, size, MMAP_HASH_WINDOW):
+                        if self.cancel_operation:
+                            return None
+                        sha256.update(view[offset:offset + MMAP_HASH_WINDOW])
+            else:
+                buf = bytearray(COPY_BUFFER_SIZE)
+                view = memoryview(buf)
+                while True:
+                    if self.cancel_operation:
+                        return None
+                    
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    sha256.update(view[:n])
+        
+        file_hash = sha256.hexdigest().upper()
+        write_hash_sidecar(path, file_hash)
+        return file_hash
+    
+    def _read_chunks(self, path, chunk_queues, stop_event, errors):
+        """Reader thread: feed the file to every queue, then a None sentinel"""
+        try:
+            with open(path, 'rb') as src:
+                while not (self.cancel_operation or stop_event.is_set()):
+                    chunk = src.read(COPY_BUFFER_SIZE)
+                    if not chunk:
+                        break
+                    for chunk_queue in chunk_queues:
+                        chunk_queue.put(chunk)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            for chunk_queue in chunk_queues:
+                chunk_queue.put(None)
+    
+    @staticmethod
+    def _hash_chunks(chunk_queue, sha256):
+        """Hasher thread: consume chunks until the None sentinel"""
+        while True:
+            chunk = chunk_queue.get()
+            if chunk is None:
+                break
+            sha256.update(chunk)
+    
+    def _show_checksum_mismatch(self, expected, actual):
+        self._show_error("Checksum Mismatch",
+                        f"ISO checksum does not match manifest.\n"
+                        f"Expected: {expected[:16]}...\n"
+                        f"Got: {actual[:16]}...")
+    
     def _update_progress(self, pct, text, speed):
-        def update():
-            self.progress_pct.configure(text=f"{pct}%")
-            self.progress_bar["value"] = pct
-            self.progress_text.configure(text=text)
-            self.progress_speed.configure(text=speed)
+        # Workers can report far more often than the UI needs to redraw, so
+        # only the latest values are kept and flushed at most every 100 ms
+        with self._progress_lock:
+            self._pending_progress = (pct, text, speed)
+            if self._progress_flush_scheduled:
+                return
+            self._progress_flush_scheduled = True
+        
+        self.root.after(PROGRESS_UPDATE_INTERVAL_MS, self._flush_progress)
+    
+    def _flush_progress(self):
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+            self._progress_flush_scheduled = False
         
-        self.root.after(0, update)
+        if pending is None:
+            return
+        pct, text, speed = pending
+        self.progress_pct.configure(text=f"{pct}%")
+        self.progress_bar["value"] = pct
+        self.progress_text.configure(text=text)
+        self.progress_speed.configure(text=speed)
+    
+    def _discard_pending_progress(self):
+        with self._progress_lock:
+            self._pending_progress = None
     
     def _install_complete(self, dest_path):
         def complete():
+            self._discard_pending_progress()
+            self._show_step(3)
             edition_name = self.validated_edition_name or "Unknown Edition"
             self.final_edition_label.configure(text=edition_name)
             if self.license_data:
                 license_key = self.license_data.get('license_key', 'N/A') if self.license_data else 'N/A'
                 self.final_license_label.configure(text=f"Key: {license_key}")
             self.final_iso_path_label.configure(text=dest_path)
-            self._show_step(3)
         
         self.root.after(0, complete)
     
     def _show_error(self, title, message):
         def show():
+            self._discard_pending_progress()
             self.progress_pct.configure(text="!", fg="#d32f2f")
             self.progress_text.configure(text=message, fg="#d32f2f")
             self.progress_speed.configure(text="")
@@ -1567,9 +1906,9 @@ class AegisLicensedInstaller:
         if sys.platform == "win32":
             os.startfile(self.install_folder)
         elif sys.platform == "darwin":
-            os.system(f'open "{self.install_folder}"')
+            subprocess.Popen(["open", self.install_folder])
         else:
-            os.system(f'xdg-open "{self.install_folder}"')
+            subprocess.Popen(["xdg-open", self.install_folder])
     
     def _open_etcher(self):
         webbrowser.open("https://etcher.balena.io/")
@@ -10,11 +10,157 @@ import threading
 import subprocess
 import platform
 import os
+import re
 import sys
-import urllib.request
-import tempfile
-import json
+import glob
+import shutil
+import queue
 import time
+import hashlib
+from functools import lru_cache
+from typing import NamedTuple
+
+USER_AGENT = "AegisOS-MediaCreator"
+# Loose shape check only; the license API decides whether a key is valid
+LICENSE_KEY_PATTERN = re.compile(r'[A-Z0-9-]{8,64}')
+# dd status=progress lines start with the byte count copied so far
+DD_PROGRESS_PATTERN = re.compile(rb'(\d+) bytes')
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+HASH_QUEUE_CHUNKS = 4
+VERIFY_CHUNK_SIZE = 4 * 1024 * 1024
+PARALLEL_DOWNLOAD_STREAMS = 4
+PARALLEL_DOWNLOAD_MIN_SIZE = 64 * 1024 * 1024
+ISO_META_SUFFIX = ".meta"
+ISO_PARTIAL_SUFFIX = ".partial"
+ISO_RANGE_STATE_SUFFIX = ".ranges.json"
+RANGE_STATE_SAVE_INTERVAL = 2.0
+FAT_PARTITION_TYPES = {0x01, 0x04, 0x06, 0x0B, 0x0C, 0x0E, 0xEF}
+PROGRESS_POLL_MS = 100
+
+FLASH_USB_PS1 = r'''
+param(
+    [Parameter(Mandatory=$true)][string]$DriveLetter,
+    [Parameter(Mandatory=$true)][string]$IsoPath
+)
+$ErrorActionPreference = "Stop"
+$drive = "${DriveLetter}:"
+
+Write-Host "Formatting drive..."
+Format-Volume -DriveLetter $DriveLetter -FileSystem FAT32 -Force -Confirm:$false | Out-Null
+
+Write-Host "Mounting ISO..."
+$mount = Mount-DiskImage -ImagePath $IsoPath -PassThru
+$vol = $mount | Get-Volume
+$isoLetter = $vol.DriveLetter
+
+Write-Host "Copying files from $isoLetter to $drive..."
+# Native, multi-threaded copy; robocopy exit codes below 8 all mean success
+& robocopy "${isoLetter}:\" "$drive\" /E /MT:16 /R:1 /W:1 /NFL /NDL /NJH /NJS | Out-Null
+if ($LASTEXITCODE -ge 8) { throw "robocopy failed with exit code $LASTEXITCODE" }
+
+Dismount-DiskImage -ImagePath $IsoPath | Out-Null
+Write-Host "Done!"
+'''
+
+class UsbDrive(NamedTuple):
+    """A drive as listed in the combo box, with its target already resolved"""
+    label: str
+    path: str  # drive letter on Windows, device node on Linux
+
+@lru_cache(maxsize=None)
+def load_kernel32():
+    """kernel32 with the drive-query prototypes declared once, so calls skip argument inference"""
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.GetLogicalDrives.argtypes = []
+    kernel32.GetLogicalDrives.restype = wintypes.DWORD
+    kernel32.GetDriveTypeW.argtypes = [wintypes.LPCWSTR]
+    kernel32.GetDriveTypeW.restype = wintypes.UINT
+    ulonglong_p = ctypes.POINTER(ctypes.c_ulonglong)
+    kernel32.GetDiskFreeSpaceExW.argtypes = [wintypes.LPCWSTR, ulonglong_p, ulonglong_p, ulonglong_p]
+    kernel32.GetDiskFreeSpaceExW.restype = wintypes.BOOL
+    return kernel32
+
+def find_fat_partition_offset(image_path):
+    """Byte offset of the first FAT partition in an image's MBR, or None"""
+    try:
+        with open(image_path, 'rb') as f:
+            mbr = f.read(512)
+    except OSError:
+        return None
+    if len(mbr) < 512 or mbr[510:512] != b'\x55\xaa':
+        return None
+    for i in range(4):
+        entry = mbr[446 + i * 16:462 + i * 16]
+        if entry[4] in FAT_PARTITION_TYPES:
+            return int.from_bytes(entry[8:12], 'little') * 512
+    return None
+
+def local_iso_state(path):
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+def read_iso_meta(meta_path):
+    import json
+    try:
+        with open(meta_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_iso_meta(meta_path, remote, sha256_hash):
+    import json
+    state = local_iso_state(meta_path[:-len(ISO_META_SUFFIX)])
+    if not (remote["etag"] or remote["last_modified"]) or state is None:
+        return
+    try:
+        with open(meta_path, 'w') as f:
+            json.dump(dict(remote, sha256=sha256_hash, mtime_ns=state[0]), f)
+    except OSError:
+        pass
+
+def read_range_state(state_path, part_path, total, validator):
+    """Remaining (next, end) ranges of an interrupted download of the same ISO"""
+    import json
+    try:
+        with open(state_path, 'r') as f:
+            state = json.load(f)
+        if (not validator or state.get("validator") != validator or state.get("size") != total
+                or os.path.getsize(part_path) != total):
+            return None
+        return [(int(start), int(end)) for start, end in state["ranges"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def write_range_state(state_path, total, validator, ranges):
+    import json
+    if not validator:
+        return
+    try:
+        with open(state_path, 'w') as f:
+            json.dump({"validator": validator, "size": total, "ranges": ranges}, f)
+    except OSError:
+        pass
+
+def sha256_file(path):
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        
+        # Older Pythons: reuse one large buffer so the loop stays read-bound
+        sha256 = hashlib.sha256()
+        buf = bytearray(VERIFY_CHUNK_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            sha256.update(view[:n])
+        return sha256.hexdigest()
 
 class AegisMediaCreator:
     def __init__(self):
@@ -26,15 +172,45 @@ class AegisMediaCreator:
         
         self.license_key = tk.StringVar()
         self.selected_drive = tk.StringVar()
-        self.progress_var = tk.DoubleVar()
-        self.status_var = tk.StringVar(value="Enter your license key to begin")
         
         self.license_info = None
+        # Drive letter -> UsbDrive (None if not removable), kept while the letter stays mounted
+        self._drive_cache = {}
+        self._drives = []
+        self._refreshing_drives = False
         self.github_base = "https://github.com/DeQuackDealer/AegisOSRepo/releases/latest/download"
         self.api_base = "https://aegis-os.replit.app"
         
-        self.setup_ui()
+        # Built on first use (see get_opener) so startup doesn't import urllib
+        self.opener = None
+        self._api_conn = None
+        self._ssl_context = None
+        
+        # Worker threads post (progress, text) here; _pump applies only the latest
+        self.ui_queue = queue.Queue()
+        self._last_status = None
         
+        self.setup_ui()
+        self._pump()
+        
+    def get_ssl_context(self):
+        if self._ssl_context is None:
+            import ssl
+            # Loading the system CA bundle is the slow part of a TLS setup, so
+            # downloads and license checks all share one context
+            self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
+    
+    def get_opener(self):
+        if self.opener is None:
+            import urllib.request
+            # Shared by every request so proxy settings are looked up once; ISOs
+            # are already compressed, so never ask for a gzip-wrapped copy
+            self.opener = urllib.request.build_opener(
+                urllib.request.HTTPSHandler(context=self.get_ssl_context()))
+            self.opener.addheaders = [('User-Agent', USER_AGENT), ('Accept-Encoding', 'identity')]
+        return self.opener
+    
     def setup_ui(self):
         main = tk.Frame(self.root, bg="#0f172a", padx=30, pady=25)
         main.pack(fill="both", expand=True)
@@ -93,11 +269,10 @@ class AegisMediaCreator:
         style = ttk.Style()
         style.configure("Custom.Horizontal.TProgressbar", thickness=25)
         
-        self.progress = ttk.Progressbar(progress_frame, variable=self.progress_var,
-                                         maximum=100, length=400)
+        self.progress = ttk.Progressbar(progress_frame, maximum=100, length=400)
         self.progress.pack(fill="x")
         
-        self.status_label = tk.Label(progress_frame, textvariable=self.status_var,
+        self.status_label = tk.Label(progress_frame, text="Enter your license key to begin",
                                       bg="#0f172a", fg="#94a3b8", font=("Segoe UI", 9))
         self.status_label.pack(pady=(8, 0))
         
@@ -116,54 +291,105 @@ class AegisMediaCreator:
         if not key:
             messagebox.showerror("Error", "Please enter a license key")
             return
+        if not LICENSE_KEY_PATTERN.fullmatch(key):
+            self.on_license_invalid("Malformed license key")
+            return
             
-        self.status_var.set("Verifying license...")
+        self.status_label.config(text="Verifying license...")
         self.verify_btn.config(state="disabled")
         
         def verify():
             try:
-                data = json.dumps({"license_key": key}).encode()
-                req = urllib.request.Request(f"{self.api_base}/api/validate-license",
-                                              data=data, headers={"Content-Type": "application/json"})
-                with urllib.request.urlopen(req, timeout=15) as resp:
-                    result = json.loads(resp.read())
-                    
-                    if result.get("valid"):
-                        self.license_info = {
-                            "key": key,
-                            "edition": result.get("edition", "gamer"),
-                            "type": result.get("license_type", "lifetime")
-                        }
-                        self.root.after(0, lambda: self.on_license_valid())
-                    else:
-                        self.root.after(0, lambda: self.on_license_invalid(result.get("error", "Invalid license")))
+                result = self.request_license_validation(key)
+                
+                if result.get("valid"):
+                    self.license_info = {
+                        "key": key,
+                        "edition": result.get("edition", "gamer"),
+                        "type": result.get("license_type", "lifetime")
+                    }
+                    self.root.after(0, lambda: self.on_license_valid())
+                else:
+                    self.root.after(0, lambda: self.on_license_invalid(result.get("error", "Invalid license")))
             except Exception as e:
-                self.root.after(0, lambda: self.on_license_invalid(f"Connection error: {e}"))
+                error = f"Connection error: {e}"
+                self.root.after(0, lambda: self.on_license_invalid(error))
         
         threading.Thread(target=verify, daemon=True).start()
     
+    def request_license_validation(self, key):
+        import json
+        import http.client
+        import urllib.request
+        from urllib.parse import urlsplit
+        
+        data = json.dumps({"license_key": key}).encode()
+        headers = {"Content-Type": "application/json", "User-Agent": USER_AGENT}
+        
+        # A direct connection can't go through a proxy, so keep urllib for that case
+        if urllib.request.getproxies().get("https"):
+            req = urllib.request.Request(f"{self.api_base}/api/validate-license",
+                                          data=data, headers=headers)
+            with self.get_opener().open(req, timeout=15) as resp:
+                return json.loads(resp.read())
+        
+        # Otherwise keep one TLS connection open so retrying a mistyped key
+        # doesn't pay for a new handshake; a connection the server has since
+        # dropped is replaced once
+        for attempt in range(2):
+            if self._api_conn is None:
+                self._api_conn = http.client.HTTPSConnection(urlsplit(self.api_base).netloc, timeout=15,
+                                                             context=self.get_ssl_context())
+            try:
+                self._api_conn.request("POST", "/api/validate-license", body=data, headers=headers)
+                resp = self._api_conn.getresponse()
+                body = resp.read()
+                break
+            except (http.client.HTTPException, OSError):
+                self._api_conn.close()
+                self._api_conn = None
+                if attempt:
+                    raise
+        
+        if resp.status >= 400:
+            raise IOError(f"HTTP Error {resp.status}: {resp.reason}")
+        return json.loads(body)
+    
     def on_license_valid(self):
         edition = self.license_info["edition"].upper()
         self.edition_label.config(text=f"Edition: {edition}", fg="#22c55e")
-        self.status_var.set(f"License verified! Ready to create {edition} edition")
+        self.status_label.config(text=f"License verified! Ready to create {edition} edition")
         self.create_btn.config(state="normal", bg="#22c55e")
         self.verify_btn.config(state="normal")
         
     def on_license_invalid(self, error):
         self.edition_label.config(text=f"Error: {error}", fg="#ef4444")
-        self.status_var.set("License verification failed")
+        self.status_label.config(text="License verification failed")
         self.verify_btn.config(state="normal")
         
     def use_freemium(self):
         self.license_info = {"key": None, "edition": "freemium", "type": "free"}
         self.edition_label.config(text="Edition: FREEMIUM (Free)", fg="#f59e0b")
-        self.status_var.set("Freemium mode - no license required")
+        self.status_label.config(text="Freemium mode - no license required")
         self.create_btn.config(state="normal", bg="#f59e0b")
         
     def refresh_drives(self):
-        drives = self.get_usb_drives()
-        self.drive_combo['values'] = drives
-        if drives and "No USB" not in drives[0]:
+        # Enumeration can stall on slow or spinning-up media, so keep it off the Tk thread
+        if self._refreshing_drives:
+            return
+        self._refreshing_drives = True
+        
+        def scan():
+            drives = self.get_usb_drives()
+            self.root.after(0, lambda: self.on_drives_found(drives))
+        
+        threading.Thread(target=scan, daemon=True).start()
+    
+    def on_drives_found(self, drives):
+        self._refreshing_drives = False
+        self._drives = drives
+        self.drive_combo['values'] = [d.label for d in drives] or ["No USB drives found"]
+        if drives:
             self.drive_combo.current(0)
             
     def get_usb_drives(self):
@@ -171,57 +397,100 @@ class AegisMediaCreator:
         if platform.system() == "Windows":
             try:
                 import ctypes
-                bitmask = ctypes.windll.kernel32.GetLogicalDrives()
-                for i, letter in enumerate('DEFGHIJKLMNOPQRSTUVWXYZ'):
-                    if bitmask & (1 << (i + 3)):
+                kernel32 = load_kernel32()
+                # Walk only the set bits from D: upwards (A:-C: are never USB sticks)
+                bitmask = kernel32.GetLogicalDrives() >> 3
+                letters = []
+                while bitmask:
+                    low = bitmask & -bitmask
+                    letters.append(chr(ord('D') + low.bit_length() - 1))
+                    bitmask ^= low
+                
+                for letter in set(self._drive_cache).difference(letters):
+                    del self._drive_cache[letter]
+                
+                for letter in letters:
+                    # Only letters that appeared since the last refresh are queried
+                    if letter not in self._drive_cache:
+                        drive = None
                         path = f"{letter}:\\"
-                        if ctypes.windll.kernel32.GetDriveTypeW(path) == 2:
+                        if kernel32.GetDriveTypeW(path) == 2:
                             try:
                                 free = ctypes.c_ulonglong()
                                 total = ctypes.c_ulonglong()
-                                ctypes.windll.kernel32.GetDiskFreeSpaceExW(path, None, ctypes.pointer(total), ctypes.pointer(free))
+                                kernel32.GetDiskFreeSpaceExW(path, None, ctypes.byref(total), ctypes.byref(free))
                                 size_gb = total.value / (1024**3)
-                                drives.append(f"{letter}: ({size_gb:.1f} GB)")
+                                drive = UsbDrive(f"{letter}: ({size_gb:.1f} GB)", letter)
                             except:
-                                drives.append(f"{letter}:")
+                                drive = UsbDrive(f"{letter}:", letter)
+                        self._drive_cache[letter] = drive
+                    
+                    if self._drive_cache[letter]:
+                        drives.append(self._drive_cache[letter])
             except:
                 pass
         elif platform.system() == "Linux":
-            try:
-                result = subprocess.run(['lsblk', '-d', '-o', 'NAME,SIZE,TRAN', '-n'], capture_output=True, text=True)
-                for line in result.stdout.strip().split('\n'):
-                    parts = line.split()
-                    if len(parts) >= 3 and parts[2] == 'usb':
-                        drives.append(f"/dev/{parts[0]} ({parts[1]})")
-            except:
-                pass
-        return drives if drives else ["No USB drives found"]
+            # Same information lsblk's TRAN column reports, read straight from sysfs
+            for dev in sorted(glob.glob('/sys/block/*')):
+                try:
+                    if '/usb' not in os.path.realpath(os.path.join(dev, 'device')):
+                        continue
+                    with open(os.path.join(dev, 'size')) as f:
+                        size_gb = int(f.read()) * 512 / (1024**3)
+                except (OSError, ValueError):
+                    continue
+                node = f"/dev/{os.path.basename(dev)}"
+                drives.append(UsbDrive(f"{node} ({size_gb:.1f} GB)", node))
+        return drives
     
     def start_creation(self):
-        drive = self.selected_drive.get()
-        if not drive or "No USB" in drive:
+        index = self.drive_combo.current()
+        if not 0 <= index < len(self._drives):
             messagebox.showerror("Error", "Please select a USB drive")
             return
+        drive = self._drives[index]
             
         if not self.license_info:
             messagebox.showerror("Error", "Please verify your license first")
             return
             
         confirm = messagebox.askyesno("Confirm",
-            f"This will ERASE ALL DATA on {drive}\n\n"
+            f"This will ERASE ALL DATA on {drive.label}\n\n"
             f"Edition: {self.license_info['edition'].upper()}\n\n"
             "Continue?")
             
         if confirm:
             self.create_btn.config(state="disabled")
             self.verify_btn.config(state="disabled")
+            self._last_status = None
             threading.Thread(target=self.create_media, args=(drive,), daemon=True).start()
     
     def update_status(self, progress, text):
-        self.progress_var.set(progress)
-        self.status_var.set(text)
+        # A whole-percent step is the smallest change the bar can show, so skip
+        # the repaint when neither that nor the text moved
+        shown = (int(progress), text)
+        if shown == self._last_status:
+            return
+        self._last_status = shown
+        
+        # Configure the widgets directly rather than through Tcl variable traces
+        self.progress.config(value=progress)
+        self.status_label.config(text=text)
+    
+    def _pump(self):
+        latest = None
+        try:
+            while True:
+                latest = self.ui_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if latest is not None:
+            self.update_status(*latest)
+        self.root.after(PROGRESS_POLL_MS, self._pump)
         
     def create_media(self, drive):
+        import json
+        import tempfile
         try:
             edition = self.license_info["edition"]
             iso_name = f"aegis-{edition}.iso"
@@ -229,25 +498,17 @@ class AegisMediaCreator:
             temp_dir = tempfile.gettempdir()
             iso_path = os.path.join(temp_dir, iso_name)
             
-            self.root.after(0, lambda: self.update_status(5, f"Downloading {iso_name}..."))
-            
-            def progress_hook(count, block, total):
-                if total > 0:
-                    pct = min(5 + (count * block / total) * 60, 65)
-                    mb = (count * block) / (1024*1024)
-                    total_mb = total / (1024*1024)
-                    self.root.after(0, lambda p=pct, m=mb, t=total_mb: 
-                        self.update_status(p, f"Downloading: {m:.0f} / {t:.0f} MB"))
+            self.ui_queue.put((5, f"Downloading {iso_name}..."))
             
             try:
-                urllib.request.urlretrieve(iso_url, iso_path, progress_hook)
+                self.download_iso(iso_url, iso_path)
             except Exception as e:
                 self.root.after(0, lambda: messagebox.showerror("Download Error",
                     f"Could not download ISO.\n\nMake sure '{iso_name}' exists at:\n{self.github_base}\n\nError: {e}"))
                 self.root.after(0, self.reset_buttons)
                 return
             
-            self.root.after(0, lambda: self.update_status(70, "Preparing USB drive..."))
+            self.ui_queue.put((70, "Preparing USB drive..."))
             
             license_data = {
                 "license_key": self.license_info["key"],
@@ -255,14 +516,15 @@ class AegisMediaCreator:
                 "license_type": self.license_info["type"],
                 "created_at": time.strftime("%Y-%m-%d %H:%M:%S")
             }
-            license_json = json.dumps(license_data, indent=2)
+            # Read once by jq on first boot, so no indentation; bytes go straight to disk
+            license_bytes = json.dumps(license_data, separators=(',', ':')).encode('utf-8')
             
-            self.root.after(0, lambda: self.update_status(80, "Writing ISO to USB..."))
+            self.ui_queue.put((80, "Writing ISO to USB..."))
             
-            success = self.flash_usb(iso_path, drive, license_json)
+            success = self.flash_usb(iso_path, drive, license_bytes)
             
             if success:
-                self.root.after(0, lambda: self.update_status(100, "Complete!"))
+                self.ui_queue.put((100, "Complete!"))
                 self.root.after(0, lambda: messagebox.showinfo("Success",
                     f"Aegis OS {edition.upper()} ready!\n\n"
                     "To install:\n"
@@ -280,53 +542,301 @@ class AegisMediaCreator:
         finally:
             self.root.after(0, self.reset_buttons)
     
-    def flash_usb(self, iso_path, drive, license_json):
+    def fetch_checksum(self, iso_url):
+        try:
+            with self.get_opener().open(f"{iso_url}.sha256", timeout=15) as resp:
+                return resp.read().decode().split()[0].lower()
+        except Exception:
+            return None
+    
+    def download_iso(self, iso_url, iso_path):
+        meta_path = iso_path + ISO_META_SUFFIX
+        headers = self.head_iso(iso_url)
+        remote = {
+            "etag": headers.get('ETag'),
+            "last_modified": headers.get('Last-Modified'),
+            "size": int(headers.get('Content-Length') or 0)
+        }
+        
+        # Same ETag/Last-Modified/size as the ISO an earlier run downloaded and
+        # verified, and untouched since: nothing to fetch, not even the checksum
+        cached = read_iso_meta(meta_path)
+        if (cached and (remote["etag"] or remote["last_modified"])
+                and all(cached.get(k) == v for k, v in remote.items())
+                and local_iso_state(iso_path) == (cached.get("mtime_ns"), remote["size"])):
+            self.ui_queue.put((65, "Using cached ISO"))
+            return cached.get("sha256")
+        
+        expected = self.fetch_checksum(iso_url)
+        
+        # An ISO left in the temp dir by an earlier run is reused if it still matches
+        if expected and os.path.isfile(iso_path):
+            self.ui_queue.put((5, "Verifying previously downloaded ISO..."))
+            if sha256_file(iso_path) == expected:
+                write_iso_meta(meta_path, remote, expected)
+                return expected
+        
+        # The old ISO is about to be overwritten, so its metadata no longer applies
+        try:
+            os.remove(meta_path)
+        except OSError:
+            pass
+        
+        validator = remote["etag"] or remote["last_modified"]
+        accepts_ranges = headers.get('Accept-Ranges', '').lower() == 'bytes'
+        total = remote["size"] if accepts_ranges else 0
+        if total >= PARALLEL_DOWNLOAD_MIN_SIZE and self.download_ranges(iso_url, iso_path, total, validator):
+            self.ui_queue.put((65, "Verifying download..."))
+            actual = sha256_file(iso_path)
+        else:
+            state_path = iso_path + ISO_PARTIAL_SUFFIX + ISO_RANGE_STATE_SUFFIX
+            if os.path.exists(state_path):
+                # An empty HEAD only means the server wasn't reachable just now;
+                # keep the saved ranges for a run that can resume them
+                if not headers:
+                    raise ConnectionError("download server unreachable (partial download kept for the next attempt)")
+                # The server answered without ranges, and a .partial filled by
+                # ranges has gaps, so it is no prefix to append to
+                for path in (state_path, iso_path + ISO_PARTIAL_SUFFIX):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            actual = self.download_stream(iso_url, iso_path, validator)
+        
+        if expected and actual != expected:
+            os.remove(iso_path)
+            raise ValueError(f"Checksum mismatch (expected {expected[:16]}..., got {actual[:16]}...)")
+        write_iso_meta(meta_path, remote, actual)
+        return actual
+    
+    def report_download(self, downloaded, total):
+        pct = min(5 + (downloaded / total) * 60, 65)
+        mb = downloaded / (1024*1024)
+        total_mb = total / (1024*1024)
+        self.ui_queue.put((pct, f"Downloading: {mb:.0f} / {total_mb:.0f} MB"))
+    
+    def head_iso(self, iso_url):
+        """Response headers for a HEAD of the ISO, or {} if the server can't be reached"""
+        import urllib.error
+        import urllib.request
+        try:
+            req = urllib.request.Request(iso_url, method="HEAD")
+            with self.get_opener().open(req, timeout=15) as resp:
+                return resp.headers
+        except urllib.error.HTTPError as e:
+            # A missing release asset fails here, before the checksum fetch or
+            # any partial download; other statuses fall back to a plain GET
+            if e.code == 404:
+                raise
+            return {}
+        except Exception:
+            return {}
+    
+    def download_ranges(self, iso_url, iso_path, total, validator=None):
+        """
+        Fetch the ISO as parallel byte ranges into its .partial file, moved into
+        place once complete; False if the server ignored the ranges. Each
+        range's progress is kept next to the .partial, so an interrupted run
+        picks up where its ranges stopped if the ISO is unchanged.
+        """
+        import urllib.request
+        from concurrent.futures import ThreadPoolExecutor, wait
+        
+        part_path = iso_path + ISO_PARTIAL_SUFFIX
+        state_path = part_path + ISO_RANGE_STATE_SUFFIX
+        ranges = read_range_state(state_path, part_path, total, validator)
+        if ranges is None:
+            with open(part_path, 'wb') as f:
+                f.truncate(total)
+            step = -(-total // PARALLEL_DOWNLOAD_STREAMS)
+            ranges = [(start, min(start + step, total) - 1) for start in range(0, total, step)]
+        
+        next_byte = [start for start, _ in ranges]
+        headers = {'If-Range': validator} if validator else {}
+        abort = threading.Event()
+        
+        def fetch(index, end):
+            try:
+                if next_byte[index] > end:
+                    return True
+                req = urllib.request.Request(iso_url, headers=dict(headers, Range=f'bytes={next_byte[index]}-{end}'))
+                with self.get_opener().open(req, timeout=30) as resp, open(part_path, 'r+b') as f:
+                    if resp.status != 206:
+                        abort.set()
+                        return False
+                    f.seek(next_byte[index])
+                    while not abort.is_set():
+                        chunk = resp.read(DOWNLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        # Counted only once it has left our buffer, since the state records it
+                        f.flush()
+                        next_byte[index] += len(chunk)
+                if next_byte[index] != end + 1 and not abort.is_set():
+                    raise IOError(f"Connection closed early before byte {end}")
+                return True
+            except Exception:
+                abort.set()
+                raise
+        
+        def downloaded():
+            return total - sum(max(end - next_byte[i] + 1, 0) for i, (_, end) in enumerate(ranges))
+        
+        def save_state():
+            write_range_state(state_path, total, validator,
+                              [[next_byte[i], end] for i, (_, end) in enumerate(ranges)])
+        
+        # Workers only count bytes; progress is reported from here at the poll rate,
+        # and the state is saved every few seconds in case the app is closed
+        last_save = time.monotonic()
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [pool.submit(fetch, i, end) for i, (_, end) in enumerate(ranges)]
+            pending = futures
+            while pending:
+                _, pending = wait(pending, timeout=PROGRESS_POLL_MS / 1000)
+                self.report_download(downloaded(), total)
+                if time.monotonic() - last_save >= RANGE_STATE_SAVE_INTERVAL:
+                    last_save = time.monotonic()
+                    save_state()
+        
+        if any(future.exception() is None and future.result() is False for future in futures):
+            # The server sent the whole ISO after all; the stream path starts over
+            for path in (state_path, part_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            return False
+        
+        for future in futures:
+            if future.exception():
+                save_state()
+                raise future.exception()
+        
+        os.replace(part_path, iso_path)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        return True
+    
+    def download_stream(self, iso_url, iso_path, validator=None):
+        import urllib.error
+        import urllib.request
+        sha256 = hashlib.sha256()
+        last_emit = 0.0
+        emit_interval = PROGRESS_POLL_MS / 1000
+        
+        # Bytes land in a .partial file that survives a dropped connection; the
+        # next attempt asks only for the rest. If-Range makes the server send the
+        # whole ISO instead if it changed since, so stale bytes are never kept.
+        part_path = iso_path + ISO_PARTIAL_SUFFIX
+        offset = os.path.getsize(part_path) if validator and os.path.isfile(part_path) else 0
+        opener = self.get_opener()
+        try:
+            headers = {'Range': f'bytes={offset}-', 'If-Range': validator} if offset else {}
+            resp = opener.open(urllib.request.Request(iso_url, headers=headers), timeout=30)
+        except urllib.error.HTTPError as e:
+            # 416: the partial file is no shorter than the ISO, so it can't be a prefix of it
+            if e.code != 416 or not offset:
+                raise
+            offset = 0
+            resp = opener.open(iso_url, timeout=30)
+        if resp.status != 206:
+            offset = 0
+        
+        if offset:
+            self.ui_queue.put((5, "Resuming download..."))
+            with open(part_path, 'rb', buffering=0) as f:
+                for chunk in iter(lambda: f.read(VERIFY_CHUNK_SIZE), b''):
+                    sha256.update(chunk)
+        downloaded = offset
+        
+        # Hash each chunk as it is written so verifying doesn't re-read the ISO.
+        # hashlib releases the GIL, so a second thread hashes while this one
+        # waits on the socket; the bounded queue caps how far it can fall behind.
+        chunks = queue.Queue(maxsize=HASH_QUEUE_CHUNKS)
+        
+        def hash_chunks():
+            for chunk in iter(chunks.get, None):
+                sha256.update(chunk)
+        
+        hasher = threading.Thread(target=hash_chunks, daemon=True)
+        hasher.start()
+        try:
+            with resp, open(part_path, 'ab' if offset else 'wb') as f:
+                total = offset + int(resp.headers.get('Content-Length', 0))
+                while True:
+                    chunk = resp.read(DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    chunks.put(chunk)
+                    downloaded += len(chunk)
+                    
+                    # The UI only redraws every PROGRESS_POLL_MS, so don't format
+                    # more often than that (the final chunk always gets through)
+                    now = time.monotonic()
+                    if total > offset and (now - last_emit >= emit_interval or downloaded >= total):
+                        last_emit = now
+                        self.report_download(downloaded, total)
+        finally:
+            chunks.put(None)
+            hasher.join()
+        
+        if total > offset and downloaded < total:
+            raise IOError(f"Connection closed after {downloaded} of {total} bytes")
+        os.replace(part_path, iso_path)
+        return sha256.hexdigest()
+    
+    def flash_usb(self, iso_path, drive, license_bytes):
+        import tempfile
         system = platform.system()
-        drive_letter = drive.split(":")[0] if ":" in drive else drive.split()[0]
+        drive_letter = drive.path
         
         try:
             if system == "Windows":
-                temp_license = os.path.join(tempfile.gettempdir(), "aegis-license.json")
-                with open(temp_license, "w") as f:
-                    f.write(license_json)
+                # Paths go in as arguments, never pasted into the script text
+                script_path = os.path.join(tempfile.gettempdir(), "aegis-flash-usb.ps1")
+                with open(script_path, "w") as f:
+                    f.write(FLASH_USB_PS1)
                 
-                ps_script = f'''
-$ErrorActionPreference = "Stop"
-$drive = "{drive_letter}:"
-$iso = "{iso_path.replace(os.sep, '/')}"
-$license = "{temp_license.replace(os.sep, '/')}"
-
-Write-Host "Formatting drive..."
-Format-Volume -DriveLetter {drive_letter} -FileSystem FAT32 -Force -Confirm:$false | Out-Null
-
-Write-Host "Mounting ISO..."
-$mount = Mount-DiskImage -ImagePath $iso -PassThru
-$vol = $mount | Get-Volume
-$isoLetter = $vol.DriveLetter
-
-Write-Host "Copying files from $isoLetter to $drive..."
-Copy-Item -Path "${{isoLetter}}:\\*" -Destination "$drive\\" -Recurse -Force
-
-Write-Host "Adding license..."
-Copy-Item -Path $license -Destination "$drive\\aegis-license.json" -Force
-
-Dismount-DiskImage -ImagePath $iso | Out-Null
-Write-Host "Done!"
-'''
                 result = subprocess.run(
-                    ["powershell", "-ExecutionPolicy", "Bypass", "-Command", ps_script],
+                    ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-File", script_path,
+                     "-DriveLetter", drive_letter, "-IsoPath", iso_path],
                     capture_output=True, text=True
                 )
-                return "Done!" in result.stdout or result.returncode == 0
+                if "Done!" not in result.stdout and result.returncode != 0:
+                    return False
+                
+                # The drive is a plain FAT32 volume now; no need to route this through PowerShell
+                with open(f"{drive_letter}:\\aegis-license.json", "wb") as f:
+                    f.write(license_bytes)
+                return True
                 
             elif system == "Linux":
-                subprocess.run(['sudo', 'dd', f'if={iso_path}', f'of={drive_letter}', 
-                               'bs=4M', 'status=progress'], check=True)
+                self.write_image(iso_path, drive_letter)
                 subprocess.run(['sync'], check=True)
                 
+                # The drive now holds the ISO byte for byte, so the ISO's own
+                # partition table says where its FAT partition starts; mcopy
+                # writes into it directly instead of a mount/write/umount cycle
+                offset = find_fat_partition_offset(iso_path)
+                if offset is not None and shutil.which('mcopy'):
+                    # mkstemp gives a fresh 0600 file, so the license isn't left
+                    # readable (or redirectable through a symlink) in /tmp
+                    fd, temp_license = tempfile.mkstemp(prefix="aegis-license-", suffix=".json")
+                    try:
+                        with os.fdopen(fd, "wb") as f:
+                            f.write(license_bytes)
+                        result = subprocess.run(['sudo', 'mcopy', '-o', '-i', f'{drive_letter}@@{offset}',
+                                                 temp_license, '::/aegis-license.json'])
+                    finally:
+                        os.unlink(temp_license)
+                    if result.returncode == 0:
+                        return True
+                
                 subprocess.run(['sudo', 'mount', drive_letter, '/mnt'], check=True)
-                with open('/mnt/aegis-license.json', 'w') as f:
-                    f.write(license_json)
+                with open('/mnt/aegis-license.json', 'wb') as f:
+                    f.write(license_bytes)
                 subprocess.run(['sudo', 'umount', '/mnt'], check=True)
                 return True
                 
@@ -336,6 +846,40 @@ Write-Host "Done!"
             
         return False
     
+    def write_image(self, iso_path, device):
+        iso_size = os.path.getsize(iso_path)
+        
+        # dd reads the ISO from our descriptor on stdin, so a sequential-access
+        # hint on it widens the kernel's readahead for dd's reads as well
+        with open(iso_path, 'rb') as src:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            dd = subprocess.Popen(['sudo', 'dd', f'of={device}', 'bs=16M', 'iflag=fullblock', 'oflag=direct',
+                                   'status=progress'],
+                                  stdin=src, stderr=subprocess.PIPE)
+            
+            # dd rewrites its progress line about once a second; relay it through
+            # the UI queue instead of leaving the bar parked at 80% until it exits
+            pending = b''
+            for data in iter(lambda: dd.stderr.read1(4096), b''):
+                *lines, pending = re.split(rb'[\r\n]', pending + data)
+                for line in lines:
+                    match = DD_PROGRESS_PATTERN.match(line)
+                    if match and iso_size:
+                        written = int(match.group(1))
+                        pct = 80 + min(written / iso_size, 1) * 18
+                        self.ui_queue.put((pct, f"Writing ISO to USB: {written / (1024*1024):.0f} / "
+                                                f"{iso_size / (1024*1024):.0f} MB"))
+            
+            dd.wait()
+            # dd has read the whole ISO through these pages and won't again; let
+            # the kernel drop them rather than evict something still in use. The
+            # device side needs no hint, oflag=direct never cached it.
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            if dd.returncode != 0:
+                raise subprocess.CalledProcessError(dd.returncode, dd.args)
+    
     def reset_buttons(self):
         self.create_btn.config(state="normal")
         self.verify_btn.config(state="normal")
@@ -13,15 +13,19 @@ from __future__ import annotations
 
 import os
 import sys
+import re
 import json
 import hashlib
+import http.client
 import threading
+import time
 import urllib.request
 import urllib.error
+import urllib.parse
 import ssl
+from concurrent.futures import ThreadPoolExecutor, wait
 import certifi
 from pathlib import Path
-from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
 
 def get_resource_path(filename: str) -> str:
@@ -58,6 +62,14 @@ except ImportError:
 VERSION = "1.0.0"
 APP_NAME = "Aegis OS Media Creation Tool"
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+PARALLEL_DOWNLOAD_STREAMS = 4
+PARALLEL_DOWNLOAD_MIN_SIZE = 64 * 1024 * 1024
+PROGRESS_INTERVAL = 0.1
+PROGRESS_POLL_MS = 33
+RANGE_STATE_SUFFIX = ".ranges.json"
+RANGE_STATE_SAVE_INTERVAL = 2.0
+
 EDITIONS = {
     "freemium": {
         "name": "Aegis OS Freemium",
@@ -141,14 +153,27 @@ class LicenseValidator:
         "AEGIS-SERV": "server"
     }
     
-    @staticmethod
-    def get_ssl_context() -> ssl.SSLContext:
-        """Get SSL context for HTTPS requests with proper certificate verification."""
-        try:
-            context = ssl.create_default_context(cafile=certifi.where())
-            return context
-        except Exception:
-            return ssl.create_default_context()
+    # One match covers the prefix lookup and the five-part check: the edition
+    # token must start with a known prefix, followed by exactly three groups
+    LICENSE_PATTERN = re.compile(
+        r"(%s)[^-]*(?:-[^-]*){3}" % "|".join(re.escape(prefix) for prefix in LICENSE_PREFIXES)
+    )
+    
+    _ssl_context: Optional[ssl.SSLContext] = None
+    _connection: Optional[http.client.HTTPSConnection] = None
+    
+    @classmethod
+    def get_ssl_context(cls) -> ssl.SSLContext:
+        """
+        Get SSL context for HTTPS requests with proper certificate verification.
+        Built once and shared, since loading the CA bundle is the slow part.
+        """
+        if cls._ssl_context is None:
+            try:
+                cls._ssl_context = ssl.create_default_context(cafile=certifi.where())
+            except Exception:
+                cls._ssl_context = ssl.create_default_context()
+        return cls._ssl_context
     
     @classmethod
     def validate_format(cls, license_key: str) -> tuple:
@@ -159,13 +184,10 @@ class LicenseValidator:
         if not license_key or not license_key.strip():
             return False, None, "Please enter a license key"
         
-        key = license_key.strip().upper()
-        
-        for prefix, edition in cls.LICENSE_PREFIXES.items():
-            if key.startswith(prefix):
-                parts = key.split("-")
-                if len(parts) == 5:
-                    return True, edition, f"Valid format for {EDITIONS[edition]['name']}"
+        match = cls.LICENSE_PATTERN.fullmatch(license_key.strip().upper())
+        if match:
+            edition = cls.LICENSE_PREFIXES[match.group(1)]
+            return True, edition, f"Valid format for {EDITIONS[edition]['name']}"
         
         return False, None, "Invalid license key format"
     
@@ -186,30 +208,59 @@ class LicenseValidator:
                 "edition": edition
             }).encode('utf-8')
             
-            request = urllib.request.Request(
-                url,
-                data=data,
-                headers={
-                    'Content-Type': 'application/json',
-                    'User-Agent': f'AegisOS-MediaTool/{VERSION}'
-                },
-                method='POST'
-            )
-            
-            context = cls.get_ssl_context()
+            headers = {
+                'Content-Type': 'application/json',
+                'User-Agent': f'AegisOS-MediaTool/{VERSION}'
+            }
             
-            with urllib.request.urlopen(request, timeout=10, context=context) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                if result.get("valid"):
-                    return True, result.get("edition", edition), "License validated successfully"
-                else:
-                    return False, None, result.get("message", "License validation failed")
+            result = cls._post_json(url, data, headers)
+            if result.get("valid"):
+                return True, result.get("edition", edition), "License validated successfully"
+            else:
+                return False, None, result.get("message", "License validation failed")
                     
-        except urllib.error.URLError:
+        except (urllib.error.URLError, OSError):
             return False, None, "Cannot validate license - no internet connection. Please connect to the internet and try again."
         except Exception as e:
             return False, None, f"License validation failed: {str(e)[:50]}"
 
+    
+    @classmethod
+    def _post_json(cls, url: str, data: bytes, headers: dict) -> dict:
+        """
+        POST to the activation server and decode the JSON reply.
+        Keeps one HTTPS connection open so validating another key doesn't
+        pay for a new TLS handshake.
+        """
+        parts = urllib.parse.urlsplit(url)
+        
+        # A direct connection can't go through a proxy, so leave those to urllib
+        if parts.scheme != 'https' or urllib.request.getproxies().get('https'):
+            request = urllib.request.Request(url, data=data, headers=headers, method='POST')
+            with urllib.request.urlopen(request, timeout=10, context=cls.get_ssl_context()) as response:
+                return json.loads(response.read().decode('utf-8'))
+        
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        for attempt in range(2):
+            if cls._connection is None:
+                cls._connection = http.client.HTTPSConnection(
+                    parts.netloc, timeout=10, context=cls.get_ssl_context())
+            try:
+                cls._connection.request('POST', path, body=data, headers=headers)
+                response = cls._connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                # The server may have closed an idle connection; reconnect once
+                cls._connection.close()
+                cls._connection = None
+                if attempt:
+                    raise
+        
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        return json.loads(body.decode('utf-8'))
+
 
 class ISODownloader:
     """Handles ISO download with progress tracking and checksum verification."""
@@ -220,9 +271,13 @@ class ISODownloader:
         self.progress_callback = progress_callback
         self.status_callback = status_callback
         self.cancelled = False
+        self._last_report = 0.0
         self.license_token = license_token
         self.download_api_url = f"{ACTIVATION_SERVER}{API_CONFIG['download']}"
         self.expected_size = EDITIONS.get(edition_id, {}).get("size_mb", 3000) * 1024 * 1024
+        self.partial_path = destination + ".part"
+        self.validator_path = self.partial_path + ".etag"
+        self.range_state_path = self.partial_path + RANGE_STATE_SUFFIX
         self.expected_checksum = self._load_expected_checksum()
     
     def _load_expected_checksum(self) -> Optional[str]:
@@ -265,11 +320,31 @@ class ISODownloader:
         Returns: (success, message, filepath)
         """
         try:
+            # An ISO already at the destination that matches the manifest needs no download
+            if self.expected_checksum and os.path.isfile(self.destination):
+                self.update_status("Checking existing ISO...")
+                self.update_progress(0, "Verifying...")
+                if self._calculate_checksum(self.destination) == self.expected_checksum.lower():
+                    self.update_progress(100, "")
+                    self.update_status("Existing ISO verified successfully!")
+                    return True, "Using cached ISO", self.destination
+            
             self.update_status(f"Requesting download from server...")
             self.update_progress(0, "Connecting...")
             
             context = LicenseValidator.get_ssl_context()
             
+            # A .part file left by an interrupted attempt is resumed from where it
+            # stopped. If-Range carries the ETag it was started under, so a server
+            # whose ISO has changed since sends the new one whole instead. A .part
+            # from parallel ranges is resumed range by range further down.
+            offset, range_header = 0, {}
+            validator = self._read_validator()
+            saved_ranges = self._load_range_state()
+            if validator and saved_ranges is None and os.path.isfile(self.partial_path):
+                offset = os.path.getsize(self.partial_path)
+                range_header = {'Range': f'bytes={offset}-', 'If-Range': validator}
+            
             download_url = f"{self.download_api_url}?edition={self.edition_id}"
             if self.license_token:
                 download_url += f"&token={self.license_token}"
@@ -278,7 +353,8 @@ class ISODownloader:
                 download_url,
                 headers={
                     'User-Agent': f'AegisOS-MediaTool/{VERSION}',
-                    'Authorization': f'Bearer {self.license_token}' if self.license_token else ''
+                    'Authorization': f'Bearer {self.license_token}' if self.license_token else '',
+                    **range_header
                 }
             )
             
@@ -293,7 +369,7 @@ class ISODownloader:
                         self.update_status("Following download link...")
                         request = urllib.request.Request(
                             actual_url,
-                            headers={'User-Agent': f'AegisOS-MediaTool/{VERSION}'}
+                            headers={'User-Agent': f'AegisOS-MediaTool/{VERSION}', **range_header}
                         )
                         response = urllib.request.urlopen(request, timeout=30, context=context)
                     elif result.get('available') == False:
@@ -301,8 +377,15 @@ class ISODownloader:
                     else:
                         return False, f"Download not available: {result.get('message', 'Please check aegis-os.com for updates.')}", None
                 
-                total_size = int(response.headers.get('Content-Length', self.expected_size))
+                # 200 instead of 206: the server sent the whole ISO, so start over
+                if response.status != 206:
+                    offset = 0
+                total_size = offset + int(response.headers.get('Content-Length', self.expected_size))
             except urllib.error.HTTPError as e:
+                if e.code == 416 and offset:
+                    # The partial file is already as long as the ISO; fetch it afresh
+                    os.remove(self.partial_path)
+                    return self.download()
                 if e.code == 404:
                     return False, "ISO file not found on server. The download server may not have this edition available yet. Please check aegis-os.com for updates.", None
                 return False, f"Download failed: HTTP {e.code}", None
@@ -311,43 +394,52 @@ class ISODownloader:
             
             self.update_status(f"Downloading {total_size / (1024*1024):.0f} MB...")
             
-            downloaded = 0
-            start_time = datetime.now()
-            chunk_size = 1024 * 1024
+            # The GET's own headers say whether the server takes ranges, so no
+            # separate HEAD is needed; when it does, this response is dropped
+            # and the ISO is fetched as parallel ranges instead
+            iso_url = response.geturl()
+            iso_headers = {k: v for k, v in request.header_items() if k not in ('Range', 'If-range')}
+            iso_validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+            ranged = False
+            if (not offset and response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+                    and response.headers.get('Content-Length')
+                    and total_size >= PARALLEL_DOWNLOAD_MIN_SIZE):
+                response.close()
+                # Saved ranges only still apply to the same, unchanged ISO
+                if saved_ranges is not None and not (
+                        validator and validator == iso_validator
+                        and saved_ranges[-1][1] == total_size - 1
+                        and os.path.getsize(self.partial_path) == total_size):
+                    saved_ranges = None
+                if saved_ranges is None:
+                    self._write_validator(iso_validator)
+                ranged = self._download_ranges(iso_url, iso_headers, total_size, saved_ranges, iso_validator)
+                if not ranged:
+                    response = urllib.request.urlopen(
+                        urllib.request.Request(iso_url, headers=iso_headers), timeout=30, context=context)
             
-            with open(self.destination, 'wb') as f:
-                while not self.cancelled:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
-                        break
-                    
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    
-                    elapsed = (datetime.now() - start_time).total_seconds()
-                    if elapsed > 0:
-                        speed = downloaded / elapsed
-                        speed_str = f"{speed / (1024*1024):.1f} MB/s"
-                        eta = (total_size - downloaded) / speed if speed > 0 else 0
-                        eta_str = f" - ETA: {int(eta)}s" if eta > 0 else ""
-                    else:
-                        speed_str = "Calculating..."
-                        eta_str = ""
-                    
-                    percent = (downloaded / total_size) * 100
-                    self.update_progress(percent, f"{speed_str}{eta_str}")
-                    self.update_status(f"Downloaded {downloaded / (1024*1024):.0f} / {total_size / (1024*1024):.0f} MB")
+            # The stream path hashes as it writes; ranges arrive out of order,
+            # so that path is hashed from disk afterwards
+            actual_checksum = None
+            if not ranged:
+                if not offset:
+                    self._discard_range_state()
+                    self._write_validator(iso_validator)
+                actual_checksum = self._download_stream(response, total_size, offset)
             
             if self.cancelled:
-                if os.path.exists(self.destination):
-                    os.remove(self.destination)
+                # The .part (and any range state) is kept for the next attempt to resume
                 return False, "Download cancelled", None
+            os.replace(self.partial_path, self.destination)
+            self._write_validator(None)
+            self._discard_range_state()
             
             self.update_progress(100, "Verifying...")
             self.update_status("Verifying download integrity...")
             
             if self.expected_checksum:
-                actual_checksum = self._calculate_checksum(self.destination)
+                if actual_checksum is None:
+                    actual_checksum = self._calculate_checksum(self.destination)
                 if actual_checksum != self.expected_checksum.lower():
                     os.remove(self.destination)
                     return False, "Download verification failed - file may be corrupted. Please try again.", None
@@ -358,15 +450,207 @@ class ISODownloader:
             return True, "ISO downloaded successfully", self.destination
             
         except Exception as e:
-            if os.path.exists(self.destination):
-                os.remove(self.destination)
+            # Nothing is written to the destination until the download is complete,
+            # and the .part is left for the next attempt to resume
             return False, f"Download error: {str(e)}", None
     
+    def _read_validator(self) -> Optional[str]:
+        """ETag or Last-Modified the partial download was started under."""
+        try:
+            with open(self.validator_path, 'r') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+    
+    def _write_validator(self, validator: Optional[str]):
+        """Record (or with None, forget) the validator for the partial download."""
+        if validator:
+            with open(self.validator_path, 'w') as f:
+                f.write(validator)
+        elif os.path.exists(self.validator_path):
+            os.remove(self.validator_path)
+    
+    def _load_range_state(self) -> Optional[list]:
+        """Remaining [next, end] byte ranges of an interrupted parallel download."""
+        # The ranges describe bytes in the .part; without it they mean nothing
+        if not os.path.isfile(self.partial_path):
+            self._discard_range_state()
+            return None
+        try:
+            with open(self.range_state_path, 'r') as f:
+                return [(int(start), int(end)) for start, end in json.load(f)["ranges"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_range_state(self, ranges: list):
+        """Record how far each range got, so the next attempt can resume."""
+        try:
+            with open(self.range_state_path, 'w') as f:
+                json.dump({"ranges": ranges}, f)
+        except OSError:
+            pass
+    
+    def _discard_range_state(self):
+        """Forget the progress of a parallel download."""
+        if os.path.exists(self.range_state_path):
+            os.remove(self.range_state_path)
+    
+    def _report_progress(self, downloaded: int, total_size: int, start_time: float, start_offset: int = 0):
+        """Report download progress, speed and ETA, at most every PROGRESS_INTERVAL."""
+        now = time.monotonic()
+        if now - self._last_report < PROGRESS_INTERVAL and downloaded < total_size:
+            return
+        self._last_report = now
+        
+        elapsed = now - start_time
+        if elapsed > 0:
+            speed = (downloaded - start_offset) / elapsed
+            speed_str = f"{speed / (1024*1024):.1f} MB/s"
+            eta = (total_size - downloaded) / speed if speed > 0 else 0
+            eta_str = f" - ETA: {int(eta)}s" if eta > 0 else ""
+        else:
+            speed_str = "Calculating..."
+            eta_str = ""
+        
+        percent = (downloaded / total_size) * 100
+        self.update_progress(percent, f"{speed_str}{eta_str}")
+        self.update_status(f"Downloaded {downloaded / (1024*1024):.0f} / {total_size / (1024*1024):.0f} MB")
+    
+    def _download_stream(self, response, total_size: int, offset: int = 0) -> str:
+        """
+        Write the response body to the partial file, appending after offset
+        bytes already there. Returns the SHA-256 of the whole file.
+        """
+        sha256_hash = hashlib.sha256()
+        if offset:
+            self.update_status("Resuming download...")
+            with open(self.partial_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    sha256_hash.update(chunk)
+        downloaded = offset
+        start_time = time.monotonic()
+        
+        # One buffer is filled in place for the whole download rather than
+        # allocating a fresh 1 MiB bytes object per read
+        buf = bytearray(DOWNLOAD_CHUNK_SIZE)
+        view = memoryview(buf)
+        
+        with response, open(self.partial_path, 'ab' if offset else 'wb') as f:
+            while not self.cancelled:
+                n = response.readinto(buf)
+                if not n:
+                    break
+                
+                f.write(view[:n])
+                sha256_hash.update(view[:n])
+                downloaded += n
+                self._report_progress(downloaded, total_size, start_time, offset)
+            
+            # urllib returns a short body without complaint; length is what was still owed
+            if not self.cancelled and response.length:
+                raise IOError(f"Connection closed after {downloaded} of {total_size} bytes")
+        
+        return sha256_hash.hexdigest().lower()
+    
+    def _download_ranges(self, url: str, headers: dict, total_size: int,
+                         ranges: Optional[list] = None, validator: Optional[str] = None) -> bool:
+        """
+        Fetch the ISO as parallel byte ranges written in place into the partial file.
+        ranges are the (next, end) pairs still to fetch when resuming; a
+        cancelled or failed run saves its own to RANGE_STATE_SUFFIX for the
+        next attempt. Returns False if the server ignored the Range header.
+        """
+        context = LicenseValidator.get_ssl_context()
+        if ranges is None:
+            # Reserve the whole ISO up front so the filesystem can hand out contiguous
+            # extents, rather than growing a sparse file range by range
+            with open(self.partial_path, 'wb') as f:
+                try:
+                    os.posix_fallocate(f.fileno(), 0, total_size)
+                except (AttributeError, OSError):
+                    f.truncate(total_size)
+            
+            step = -(-total_size // PARALLEL_DOWNLOAD_STREAMS)
+            ranges = [(start, min(start + step, total_size) - 1) for start in range(0, total_size, step)]
+        
+        next_byte = [start for start, _ in ranges]
+        abort = threading.Event()
+        if validator:
+            headers = {**headers, 'If-Range': validator}
+        
+        def fetch(index: int, end: int) -> bool:
+            try:
+                if next_byte[index] > end:
+                    return True
+                request = urllib.request.Request(url, headers={**headers, 'Range': f'bytes={next_byte[index]}-{end}'})
+                with urllib.request.urlopen(request, timeout=30, context=context) as response, \
+                        open(self.partial_path, 'r+b') as f:
+                    if response.status != 206:
+                        abort.set()
+                        return False
+                    f.seek(next_byte[index])
+                    buf = bytearray(DOWNLOAD_CHUNK_SIZE)
+                    view = memoryview(buf)
+                    while not (abort.is_set() or self.cancelled):
+                        n = response.readinto(buf)
+                        if not n:
+                            break
+                        f.write(view[:n])
+                        # Only count what has left our buffer, since the state records it
+                        f.flush()
+                        next_byte[index] += n
+                if next_byte[index] != end + 1 and not (abort.is_set() or self.cancelled):
+                    raise IOError(f"Connection closed early before byte {end}")
+                return True
+            except Exception:
+                abort.set()
+                raise
+        
+        def remaining() -> int:
+            return sum(max(end - next_byte[i] + 1, 0) for i, (_, end) in enumerate(ranges))
+        
+        def save_state():
+            self._save_range_state([[next_byte[i], end] for i, (_, end) in enumerate(ranges)])
+        
+        # Workers only count bytes; progress is reported from this thread. The
+        # state is also saved every few seconds in case the window is closed
+        # mid-download and the workers never get to stop cleanly.
+        start_time = last_save = time.monotonic()
+        start_offset = total_size - remaining()
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [pool.submit(fetch, i, end) for i, (_, end) in enumerate(ranges)]
+            pending = futures
+            while pending:
+                _, pending = wait(pending, timeout=0.1)
+                self._report_progress(total_size - remaining(), total_size, start_time, start_offset)
+                if time.monotonic() - last_save >= RANGE_STATE_SAVE_INTERVAL:
+                    last_save = time.monotonic()
+                    save_state()
+        
+        if any(future.exception() is None and future.result() is False for future in futures):
+            # The server sent the whole ISO after all; the caller streams it instead
+            self._discard_range_state()
+            return False
+        
+        if self.cancelled or abort.is_set():
+            save_state()
+            for future in futures:
+                if future.exception():
+                    raise future.exception()
+        return True
+    
     def _calculate_checksum(self, filepath: str) -> str:
         """Calculate SHA-256 checksum of a file."""
-        sha256_hash = hashlib.sha256()
         with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
+            # Python 3.11+ hashes the file in C without a bytes object per read
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest().lower()
+            
+            sha256_hash = hashlib.sha256()
+            for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
                 sha256_hash.update(chunk)
         return sha256_hash.hexdigest().lower()
 
@@ -386,6 +670,7 @@ class MediaCreationToolGUI:
         self.save_path = tk.StringVar()
         self.downloader = None
         self.download_thread = None
+        self._poll_id = None
         
         self._setup_styles()
         self._show_welcome_screen()
@@ -400,6 +685,9 @@ class MediaCreationToolGUI:
     
     def _clear_frame(self):
         """Clear the current frame."""
+        if self._poll_id:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
         if self.current_frame:
             self.current_frame.destroy()
         self.current_frame = ttk.Frame(self.root, padding=20)
@@ -497,12 +785,13 @@ class MediaCreationToolGUI:
         btn_frame = ttk.Frame(self.current_frame)
         btn_frame.pack(pady=20)
         
-        ttk.Button(
+        self.validate_btn = ttk.Button(
             btn_frame,
             text="Validate & Download",
             style='Big.TButton',
             command=self._validate_and_download
-        ).pack(side='left', padx=10)
+        )
+        self.validate_btn.pack(side='left', padx=10)
         
         ttk.Button(
             btn_frame,
@@ -519,9 +808,20 @@ class MediaCreationToolGUI:
             return
         
         self.validation_label.config(text="Validating license...", foreground='blue')
-        self.root.update()
+        self.validate_btn.config(state='disabled')
         
+        threading.Thread(target=self._run_validation, args=(key,), daemon=True).start()
+    
+    def _run_validation(self, key: str) -> None:
+        """Validate the license key in a background thread."""
         valid, edition, message = LicenseValidator.validate_online(key)
+        self.root.after(0, lambda: self._validation_complete(key, valid, edition, message))
+    
+    def _validation_complete(self, key: str, valid: bool, edition: Optional[str], message: str):
+        """Handle the validation result (main thread)."""
+        # The user may have gone Back while the server was answering
+        if not self.validation_label.winfo_exists():
+            return
         
         if valid and edition:
             self.validation_label.config(
@@ -529,9 +829,17 @@ class MediaCreationToolGUI:
                 foreground='green'
             )
             self.validated_license_key = key
-            self.root.after(1000, lambda: self._start_download(edition))
+            
+            def start():
+                self._start_download(edition)
+                # Still on this screen if the save dialog was cancelled
+                if self.validate_btn.winfo_exists():
+                    self.validate_btn.config(state='normal')
+            
+            self.root.after(1000, start)
         else:
             self.validation_label.config(text=message, foreground='red')
+            self.validate_btn.config(state='normal')
     
     def _start_download(self, edition_id: str):
         """Start the download process."""
@@ -619,13 +927,39 @@ class MediaCreationToolGUI:
             license_token=license_token
         )
         
+        self._progress_state = self._shown_progress = None
+        self._status_state = self._shown_status = None
+        self._poll_progress()
+        
         self.download_thread = threading.Thread(target=self._run_download)
         self.download_thread.daemon = True
         self.download_thread.start()
     
     def _update_progress(self, percent: float, speed: str):
-        """Update progress bar (thread-safe)."""
-        self.root.after(0, lambda: self._do_update_progress(percent, speed))
+        """Record the latest progress for _poll_progress to draw (thread-safe)."""
+        self._progress_state = (percent, speed)
+    
+    def _update_status(self, message: str):
+        """Record the latest status for _poll_progress to draw (thread-safe)."""
+        self._status_state = message
+    
+    def _poll_progress(self):
+        """
+        Draw the latest progress and status (main thread).
+        Runs at a fixed rate, so how often the download thread reports
+        doesn't change how often Tk repaints.
+        """
+        progress = self._progress_state
+        if progress is not None and progress != self._shown_progress:
+            self._shown_progress = progress
+            self._do_update_progress(*progress)
+        
+        status = self._status_state
+        if status is not None and status != self._shown_status:
+            self._shown_status = status
+            self.status_label.config(text=status)
+        
+        self._poll_id = self.root.after(PROGRESS_POLL_MS, self._poll_progress)
     
     def _do_update_progress(self, percent: float, speed: str):
         """Actually update progress (main thread)."""
@@ -633,10 +967,6 @@ class MediaCreationToolGUI:
         self.progress_label.config(text=f"{percent:.1f}%")
         self.speed_label.config(text=speed)
     
-    def _update_status(self, message: str):
-        """Update status label (thread-safe)."""
-        self.root.after(0, lambda: self.status_label.config(text=message))
-    
     def _run_download(self) -> None:
         """Run the download in background thread."""
         if self.downloader is None:
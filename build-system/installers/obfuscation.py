@@ -7,10 +7,17 @@ Provides string encryption, integrity checks, and anti-tampering for installers
 import base64
 import hashlib
 import os
+import re
 import zlib
 import sys
 from typing import Tuple
 
+VALID_KEY_PREFIXES = frozenset({'FREE', 'BSIC', 'GMRP', 'AIDV', 'WKPL', 'SRVR', 'GMAI'})
+# PREFIX-XXXX-XXXX-XXXX; [^\W_] is exactly the str.isalnum() character set
+KEY_FORMAT_PATTERN = re.compile(
+    r'(?:' + '|'.join(sorted(VALID_KEY_PREFIXES)) + r')(?:-[^\W_]{4}){3}'
+)
+
 
 class StringProtector:
     """Encrypt/decrypt sensitive strings at runtime"""
@@ -135,22 +142,7 @@ class LicenseProtection:
         if not license_key:
             return False
         
-        parts = license_key.split('-')
-        if len(parts) != 4:
-            return False
-        
-        prefix = parts[0]
-        valid_prefixes = {'FREE', 'BSIC', 'GMRP', 'AIDV', 'WKPL', 'SRVR', 'GMAI'}
-        if prefix not in valid_prefixes:
-            return False
-        
-        for segment in parts[1:]:
-            if len(segment) != 4:
-                return False
-            if not all(c.isalnum() for c in segment):
-                return False
-        
-        return True
+        return KEY_FORMAT_PATTERN.fullmatch(license_key) is not None
     
     @staticmethod
     def obfuscate_public_key(pem_key: str) -> str:
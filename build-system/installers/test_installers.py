@@ -300,6 +300,105 @@ def test_obfuscation():
         return False
 
 
+def test_parallel_download_finalize():
+    """Test that finishing a parallel download onto an existing ISO is reported, not raised"""
+    print("Testing parallel download finalization...")
+    
+    from importlib.util import spec_from_loader, module_from_spec
+    from importlib.machinery import SourceFileLoader
+    
+    for name in ('tkinter', 'tkinter.ttk', 'tkinter.messagebox', 'tkinter.filedialog'):
+        sys.modules.setdefault(name, type(sys)(name))
+    
+    loader = SourceFileLoader("freemium", str(Path(__file__).parent / "aegis-installer-freemium.py"))
+    spec = spec_from_loader("freemium", loader)
+    if spec is None:
+        print("  ✗ Could not load freemium module spec")
+        return False
+    freemium = module_from_spec(spec)
+    loader.exec_module(freemium)
+    freemium.PARALLEL_DOWNLOAD_MIN_SIZE = 0
+    
+    data = os.urandom(256 * 1024)
+    expected = hashlib.sha256(data).hexdigest().upper()
+    
+    def make_downloader():
+        downloader = freemium.ISODownloader()
+        downloader._check_internet = lambda: True
+        downloader._get_range_download_size = lambda url: len(data)
+        
+        def fetch_range(url, partial_path, index, end, abort):
+            start = downloader._range_next[index]
+            with open(partial_path, 'r+b') as f:
+                f.seek(start)
+                f.write(data[start:end + 1])
+            downloader._range_next[index] = end + 1
+            return True
+        
+        downloader._download_range = fetch_range
+        return downloader
+    
+    real_rename = os.rename
+    real_replace = os.replace
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # The user answered "Replace it?" with Yes, so the ISO already exists.
+            # On Windows only os.replace overwrites it; os.rename (and Path.rename,
+            # which calls it) refuses, so that is what rename does here too
+            destination = os.path.join(temp_dir, "aegis-freemium.iso")
+            with open(destination, 'wb') as f:
+                f.write(b"old iso")
+            
+            def rename_like_windows(src, dst, *args, **kwargs):
+                if os.path.exists(dst):
+                    raise FileExistsError(f"Cannot create a file when that file already exists: {dst}")
+                return real_rename(src, dst, *args, **kwargs)
+            os.rename = rename_like_windows
+            
+            success, message, sha256_hash = make_downloader().download("https://example.invalid/a.iso",
+                                                                       destination, expected)
+            if not success or sha256_hash != expected:
+                print(f"  ✗ Download onto an existing ISO failed: {message}")
+                return False
+            with open(destination, 'rb') as f:
+                if f.read() != data:
+                    print("  ✗ Existing ISO was not replaced")
+                    return False
+            print("  ✓ Existing ISO replaced")
+            
+            def replace_denied(src, dst):
+                raise PermissionError(f"Access is denied: {dst}")
+            os.replace = replace_denied
+            
+            try:
+                success, message, _ = make_downloader().download("https://example.invalid/a.iso",
+                                                                  destination, expected)
+            except Exception as e:
+                print(f"  ✗ Finalization error escaped download(): {e!r}")
+                return False
+            if success:
+                print("  ✗ Failed finalization reported as success")
+                return False
+            print(f"  ✓ Finalization error reported: {message[:40]}...")
+            
+            os.replace = real_replace
+            success, message, _ = make_downloader().download("https://example.invalid/a.iso",
+                                                              destination, expected)
+            if not success:
+                print(f"  ✗ Retry after failed finalization failed: {message}")
+                return False
+            print("  ✓ Retry finishes the kept download")
+        
+        return True
+        
+    except Exception as e:
+        print(f"  ✗ Parallel download test failed: {e}")
+        return False
+    finally:
+        os.rename = real_rename
+        os.replace = real_replace
+
+
 def test_python_syntax():
     """Test that all installer files have valid Python syntax"""
     print("Testing Python syntax...")
@@ -349,6 +448,7 @@ def main():
         ("Activation Client", test_activation_client),
         ("Obfuscation", test_obfuscation),
         ("Offline ISO Locator", test_offline_iso_locator),
+        ("Parallel Download Finalization", test_parallel_download_finalize),
     ]
     
     results = []